@@ -10,11 +10,140 @@ import xml.etree.ElementTree as ET
 import glob
 import os
 import re
+import sys
 import argparse
+import io
 import yaml
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from alto2tei import ConfigurationLoader as BaseConfigurationLoader, AltoToTeiConverter
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, TextIO, Tuple, Any
+from alto2tei import ConfigurationLoader as BaseConfigurationLoader, combine_patterns
+
+ALTO_NS = {'alto': 'http://www.loc.gov/standards/alto/ns-v4#'}
+
+SOFT_HYPHEN = '\u00ad'
+
+# Backslash-escapes for characters with Markdown meaning in raw OCR text
+MARKDOWN_ESCAPE_TABLE = str.maketrans({char: '\\' + char for char in '\\`*_{}[]()#+-.!|>'})
+
+def normalize_line_text(text: str) -> str:
+    """Collapse whitespace runs to single spaces and drop soft hyphens"""
+    if SOFT_HYPHEN in text:
+        text = text.replace(SOFT_HYPHEN, '')
+    return ' '.join(text.split())
+
+class CompiledLineConfig(NamedTuple):
+    """Line type configuration resolved once when the rule engine is built"""
+    template: str
+    markdown_format: str
+    container: Optional[str]
+    paragraph_type: str
+    normalize: bool
+    identity_template: bool  # Template is exactly '{text}'
+    prefix: str
+    suffix: str
+    render: Optional[Callable[[str], str]]  # Only set when the template is not a plain '{text}' wrapper
+    emit: Callable[['_PageBuilder', str], None]  # _PageBuilder handler for this line type
+
+@dataclass(frozen=True, slots=True)
+class CompiledRules:
+    """Document-level Markdown settings resolved once from the rule engine"""
+    paragraph_separator: str
+    line_separator: str
+    preserve_line_breaks: bool
+    escape_markdown: bool
+    include_page_breaks: bool
+    page_break_template: str
+    merge_lines: bool
+    merge_paragraph_lines: bool
+    merge_verse_lines: bool
+    line_joiner: str
+    handle_hyphenation: bool
+    find_hyphen: Callable[[str], Optional[re.Match]]
+    word_break_chars: Tuple[str, ...]
+    page_number_block_types: frozenset
+    processable_block_types: frozenset  # Content blocks plus page number blocks
+
+class _PageBuilder:
+    """Mutable Markdown assembly state for a single page"""
+    __slots__ = ('paragraph', 'container', 'container_lines', 'page_content')
+    
+    def __init__(self):
+        self.paragraph: List[str] = []
+        self.container: Optional[str] = None
+        self.container_lines: List[str] = []
+        self.page_content: List[str] = []
+    
+    def close_paragraph(self) -> None:
+        """Emit the open paragraph, if any"""
+        if self.paragraph:
+            self.page_content.append(' '.join(self.paragraph))
+            self.paragraph.clear()
+    
+    def close_container(self) -> None:
+        """Emit the open container (e.g. a poetry block), if any"""
+        if self.container and self.container_lines:
+            self.page_content.append('\n'.join(self.container_lines))
+            self.container_lines.clear()
+            self.container = None
+    
+    def add_standalone(self, rendered: str) -> None:
+        """Close the open paragraph and container, then add a standalone element"""
+        self.close_paragraph()
+        self.close_container()
+        self.page_content.append(rendered)
+    
+    def add_container_line(self, container: str, rendered: str) -> None:
+        """Add a line to a container element (like poetry), switching containers if needed"""
+        if self.container and self.container != container:
+            if self.container_lines:
+                self.page_content.append('\n'.join(self.container_lines))
+            self.container_lines.clear()
+        self.container = container
+        self.container_lines.append(rendered)
+    
+    def start_paragraph(self, rendered: str) -> None:
+        """Close the open paragraph and start a new one with this line"""
+        self.close_paragraph()
+        self.paragraph.append(rendered)
+    
+    def add_paragraph_line(self, rendered: str) -> None:
+        """Add a line to the open paragraph"""
+        self.paragraph.append(rendered)
+    
+    def add_line(self, rendered: str) -> None:
+        """Default: close the open paragraph and add the line on its own"""
+        self.close_paragraph()
+        self.page_content.append(rendered)
+    
+    def finalize(self) -> List[str]:
+        """Emit any remaining content and return the page's Markdown blocks"""
+        self.close_paragraph()
+        if self.container and self.container_lines:
+            self.page_content.append('\n'.join(self.container_lines))
+        return self.page_content
+
+class _TagTypeCache(dict):
+    """TAGREFS value -> resolved block/line type, filled on first lookup"""
+    
+    def __init__(self, tags_mapping: Dict[str, str], tag_prefix: str, default: str):
+        super().__init__()
+        self.tags_mapping = tags_mapping
+        self.tag_prefix = tag_prefix
+        self.default = default
+    
+    def __missing__(self, tagrefs: str) -> str:
+        # Same resolution as AltoToTeiConverter.resolve_tagrefs: first matching reference wins
+        tag_type = self.default
+        for tagref in tagrefs.split():
+            if tagref.startswith(self.tag_prefix) and tagref in self.tags_mapping:
+                tag_type = self.tags_mapping[tagref]
+                break
+        self[tagrefs] = tag_type
+        return tag_type
 
 class MarkdownConfigurationLoader(BaseConfigurationLoader):
     """Loads and manages ALTO-Markdown transformation rules from YAML configuration"""
@@ -44,12 +173,107 @@ class MarkdownRuleEngine:
     
     def __init__(self, config_loader: MarkdownConfigurationLoader):
         self.config = config_loader
-        self.block_types = config_loader.get_block_types()
-        self.line_types = config_loader.get_line_types()
+        # Interned type names, so probes with interned ALTO labels compare by identity
+        self.block_types = {sys.intern(k): v for k, v in config_loader.get_block_types().items()}
+        self.line_types = {sys.intern(k): v for k, v in config_loader.get_line_types().items()}
         self.markdown_structure = config_loader.get_markdown_structure()
         self.page_handling = config_loader.get_page_handling()
         self.line_merging = config_loader.get_line_merging()
         self.hyphenation = config_loader.get_hyphenation()
+        
+        # Resolve line type settings once instead of on every processed line
+        self._compiled_lines = {
+            line_type: self._compile_line_config(line_config)
+            for line_type, line_config in self.line_types.items()
+        }
+        self._default_compiled_line = self._compile_line_config(self.line_types.get('DefaultLine', {}))
+        
+        # Block types that yield either content or a page number; everything else is dropped unread
+        self._processable_blocks = frozenset(
+            block_type for block_type in self.block_types
+            if self.should_process_block(block_type) or self.should_extract_page_number(block_type)
+        )
+        
+        # Hyphen patterns folded into one precompiled alternation where that is safe
+        self._compiled_hyphen_patterns = [re.compile(pattern) for pattern in self.get_hyphen_patterns()]
+        combined_hyphen_pattern = combine_patterns(self._compiled_hyphen_patterns)
+        self.find_hyphen = (combined_hyphen_pattern.search if combined_hyphen_pattern is not None
+                            else self._find_hyphen_separately)
+        self.word_break_tuple = tuple(self.get_word_break_chars())
+    
+    def _find_hyphen_separately(self, line: str) -> Optional[re.Match]:
+        """Search a line with each hyphenation pattern in turn, returning the first match"""
+        for pattern in self._compiled_hyphen_patterns:
+            match = pattern.search(line)
+            if match:
+                return match
+        return None
+    
+    def _compile_line_config(self, line_config: Dict[str, Any]) -> CompiledLineConfig:
+        """Flatten a YAML line type configuration into a CompiledLineConfig"""
+        template = line_config.get('template', '{text}')
+        
+        # Split simple templates like '> {text}' into literal prefix/suffix
+        render = None
+        prefix, _, suffix = template.partition('{text}')
+        if not _ or any(brace in part for part in (prefix, suffix) for brace in '{}'):
+            prefix = suffix = ''
+            render = lambda text: template.format(text=text)
+        
+        markdown_format = line_config.get('markdown_format', 'paragraph')
+        standalone = bool(line_config.get('standalone'))
+        container = line_config.get('container')
+        add_to_paragraph = bool(line_config.get('add_to_paragraph'))
+        starts_paragraph = bool(line_config.get('starts_paragraph'))
+        
+        # Pick the page builder handler once instead of testing the flags on every line
+        if standalone:
+            if markdown_format == 'divider':
+                # Dividers are emitted without the line text
+                emit = lambda builder, rendered: builder.add_standalone(template)
+            else:
+                emit = _PageBuilder.add_standalone
+        elif container:
+            emit = lambda builder, rendered: builder.add_container_line(container, rendered)
+        elif starts_paragraph:
+            emit = _PageBuilder.start_paragraph
+        elif add_to_paragraph:
+            emit = _PageBuilder.add_paragraph_line
+        else:
+            emit = _PageBuilder.add_line
+        
+        return CompiledLineConfig(
+            template=template,
+            markdown_format=markdown_format,
+            container=container,
+            paragraph_type=line_config.get('paragraph_type', 'default'),
+            normalize=bool(line_config.get('normalize')),
+            identity_template=(template == '{text}'),
+            prefix=prefix,
+            suffix=suffix,
+            render=render,
+            emit=emit
+        )
+    
+    def compile_rules(self) -> CompiledRules:
+        """Freeze the current settings into plain attributes for the conversion loops"""
+        return CompiledRules(
+            paragraph_separator=self.get_paragraph_separator(),
+            line_separator=self.get_line_separator(),
+            preserve_line_breaks=self.should_preserve_line_breaks(),
+            escape_markdown=self.should_escape_markdown(),
+            include_page_breaks=self.should_include_page_breaks(),
+            page_break_template=self.get_page_break_template(),
+            merge_lines=self.should_merge_lines(),
+            merge_paragraph_lines=self.should_merge_paragraph_lines(),
+            merge_verse_lines=self.should_merge_verse_lines(),
+            line_joiner=self.get_line_joiner(),
+            handle_hyphenation=self.should_handle_hyphenation(),
+            find_hyphen=self.find_hyphen,
+            word_break_chars=self.word_break_tuple,
+            page_number_block_types=frozenset(bt for bt in self.block_types if self.should_extract_page_number(bt)),
+            processable_block_types=self._processable_blocks
+        )
     
     def should_process_block(self, block_type: str) -> bool:
         """Check if a block type should be processed for content"""
@@ -70,6 +294,10 @@ class MarkdownRuleEngine:
         """Get Markdown mapping configuration for a line type"""
         return self.line_types.get(line_type, self.line_types.get('DefaultLine', {}))
     
+    def get_compiled_line(self, line_type: str) -> CompiledLineConfig:
+        """Get precompiled Markdown mapping for a line type"""
+        return self._compiled_lines.get(line_type, self._default_compiled_line)
+    
     def get_paragraph_separator(self) -> str:
         """Get paragraph separator for Markdown"""
         return self.markdown_structure.get('paragraph_separator', '\n\n')
@@ -82,6 +310,10 @@ class MarkdownRuleEngine:
         """Check if line breaks should be preserved"""
         return self.markdown_structure.get('preserve_line_breaks', True)
     
+    def should_escape_markdown(self) -> bool:
+        """Check if Markdown special characters in line text should be escaped"""
+        return self.markdown_structure.get('escape_markdown', False)
+    
     def should_include_page_breaks(self) -> bool:
         """Check if page breaks should be included"""
         return self.page_handling.get('include_page_breaks', True)
@@ -122,61 +354,126 @@ class AltoToMarkdownConverter:
     """Convert ALTO XML to Markdown format using configuration-driven approach"""
     
     def __init__(self, config_path: str = "config/alto_markdown_mapping.yaml", merge_lines: bool = False):
-        # Reuse ALTO parsing logic from TEI converter
-        self.tei_converter = AltoToTeiConverter()
-        self.alto_ns = self.tei_converter.alto_ns
+        self.alto_ns = ALTO_NS
+        
+        # Namespace-qualified tags matched while streaming the ALTO file
+        alto_uri = self.alto_ns['alto']
+        self._tags_tag = f'{{{alto_uri}}}Tags'
+        self._other_tag_tag = f'{{{alto_uri}}}OtherTag'
+        self._page_tag = f'{{{alto_uri}}}Page'
+        self._textblock_tag = f'{{{alto_uri}}}TextBlock'
+        self._textline_tag = f'{{{alto_uri}}}TextLine'
+        self._string_tag = f'{{{alto_uri}}}String'
         
         # Load Markdown-specific configuration
+        self.config_path = config_path
         self.config_loader = MarkdownConfigurationLoader(config_path)
         self.rule_engine = MarkdownRuleEngine(self.config_loader)
         
         # Override line merging setting if specified
         self.merge_lines = merge_lines
+        self.rules = self.rule_engine.compile_rules()
     
     def convert_alto_to_markdown(self, alto_file: Path) -> str:
         """Convert an ALTO file to Markdown text"""
-        
-        # Parse ALTO file using existing logic
-        tree = ET.parse(alto_file)
-        alto_root = tree.getroot()
-        tags_mapping = self.tei_converter.parse_alto_tags(alto_root)
+        buf = io.StringIO()
+        self.write_markdown(alto_file, buf)
+        return buf.getvalue()
+    
+    def write_markdown(self, alto_file: Path, out: TextIO) -> None:
+        """Convert an ALTO file and write the Markdown to an open text stream page by page"""
+        # Stream pages instead of building the whole ALTO tree
+        pages = self._iter_pages(alto_file)
         
         # Check if line merging is enabled (either from config or parameter)
-        merge_enabled = self.merge_lines or self.rule_engine.should_merge_lines()
+        merge_enabled = self.merge_lines or self.rules.merge_lines
         
         if merge_enabled:
-            return self._convert_with_line_merging(alto_root, tags_mapping)
+            self._convert_with_line_merging(pages, out)
         else:
-            return self._convert_without_line_merging(alto_root, tags_mapping)
-    
-    def _convert_without_line_merging(self, alto_root, tags_mapping) -> str:
+            self._convert_without_line_merging(pages, out)
+    
+    def _iter_pages(self, alto_file: Path) -> Iterator[Tuple[List[Tuple[ET.Element, str]], Dict[str, str]]]:
+        """Stream (blocks, line_types) pairs from an ALTO file, one per page
+        
+        Blocks are classified as soon as they have been parsed. Blocks that
+        neither carry content nor a page number are cleared right away instead
+        of being kept until the end of the page. ALTO places the Tags section
+        before Layout, so the mapping is complete by then. line_types maps a
+        TextLine's TAGREFS value to its line type.
+        """
+        processable_block_types = self.rules.processable_block_types
+        block_types = _TagTypeCache({}, 'BT', 'MainZone')
+        line_types = _TagTypeCache({}, 'LT', 'DefaultLine')
+        blocks = []
+        for _, elem in ET.iterparse(str(alto_file), events=('end',)):
+            tag = elem.tag
+            if tag == self._textblock_tag:
+                block_type = block_types[elem.get('TAGREFS', '')]
+                if block_type in processable_block_types:
+                    blocks.append((elem, block_type))
+                else:
+                    elem.clear()
+            elif tag == self._page_tag:
+                # Pages without any processable block produce no output
+                if blocks:
+                    yield blocks, line_types
+                    blocks = []
+                elem.clear()
+            elif tag == self._tags_tag:
+                tags_mapping = self._parse_tags_section(elem)
+                block_types = _TagTypeCache(tags_mapping, 'BT', 'MainZone')
+                line_types = _TagTypeCache(tags_mapping, 'LT', 'DefaultLine')
+    
+    def _parse_tags_section(self, tags_section: ET.Element) -> Dict[str, str]:
+        """Get type mappings (tag ID -> label) from the ALTO Tags element"""
+        tags = {}
+        for tag in tags_section.findall(self._other_tag_tag):
+            tag_id = tag.get('ID')
+            label = tag.get('LABEL')
+            if tag_id and label:
+                tags[tag_id] = sys.intern(label)
+        return tags
+    
+    def _extract_page_number(self, textblock: ET.Element) -> Optional[str]:
+        """Extract page number from a NumberingZone block"""
+        page_text = ' '.join(
+            string.get('CONTENT', '')
+            for string in textblock.iter(self._string_tag)
+            if string.get('CONTENT', '').strip()
+        ).strip()
+        
+        # Basic validation - should be mostly numeric
+        if page_text and any(map(str.isdigit, page_text)):
+            return page_text
+        return None
+    
+    def _convert_without_line_merging(self, pages, out: TextIO) -> None:
         """Convert without line merging (original behavior)"""
-        markdown_sections = []
+        has_sections = False
         page_number = None
         
+        # Loop-invariant lookups bound once per conversion
+        page_number_block_types = self.rules.page_number_block_types
+        textline_tag = self._textline_tag
+        string_tag = self._string_tag
+        get_compiled_line = self.rule_engine.get_compiled_line
+        process_line = self._process_line_to_markdown
+        
         # Process each page
-        for page in alto_root.findall('.//alto:Page', self.alto_ns):
-            page_content = []
-            current_paragraph = []
-            current_container = None
-            container_lines = []
+        for blocks, line_types in pages:
+            builder = _PageBuilder()
             
             # Process textblocks
-            for textblock in page.findall('.//alto:TextBlock', self.alto_ns):
-                block_type = self.tei_converter.get_block_type(textblock, tags_mapping)
-                
+            for textblock, block_type in blocks:
                 # Handle page number extraction
-                if self.rule_engine.should_extract_page_number(block_type):
-                    page_number = self.tei_converter.extract_page_number(textblock)
-                    continue
-                
-                # Skip non-content blocks
-                if not self.rule_engine.should_process_block(block_type):
+                if block_type in page_number_block_types:
+                    page_number = self._extract_page_number(textblock)
                     continue
                 
-                # Process textlines
-                for textline in textblock.findall('.//alto:TextLine', self.alto_ns):
-                    string_elem = textline.find('alto:String', self.alto_ns)
+                # Process textlines (always direct children of TextBlock in ALTO)
+                for textline in textblock.iterfind(textline_tag):
+                    string_elem = textline.find(string_tag)
                     if string_elem is None:
                         continue
                     
@@ -184,53 +481,39 @@ class AltoToMarkdownConverter:
                     if not text_content:
                         continue
                     
-                    # Get line type and markdown mapping
-                    line_type = self.tei_converter.get_line_type(textline, tags_mapping)
-                    line_config = self.rule_engine.get_line_mapping(line_type)
+                    # Get line type and its compiled markdown mapping
+                    line_type = line_types[textline.get('TAGREFS', '')]
+                    line_config = get_compiled_line(line_type)
                     
                     # Process line to markdown
-                    result = self._process_line_to_markdown(
-                        text_content, line_config, current_paragraph, 
-                        current_container, container_lines, page_content
-                    )
-                    
-                    if result:
-                        current_paragraph, current_container, container_lines = result
+                    process_line(text_content, line_config, builder)
             
             # Finalize any remaining content
-            self._finalize_page_content(current_paragraph, current_container, 
-                                      container_lines, page_content)
+            page_content = builder.finalize()
             
-            # Add page break if configured and we have content
-            if page_content and self.rule_engine.should_include_page_breaks() and page_number:
-                page_break = self.rule_engine.get_page_break_template().format(page_number=page_number)
-                markdown_sections.append(page_break + '\n'.join(page_content))
-            elif page_content:
-                markdown_sections.append('\n'.join(page_content))
-        
-        return self.rule_engine.get_paragraph_separator().join(markdown_sections)
+            has_sections = self._write_page(out, page_content, page_number, has_sections)
     
-    def _convert_with_line_merging(self, alto_root, tags_mapping) -> str:
+    def _convert_with_line_merging(self, pages, out: TextIO) -> None:
         """Convert with line merging enabled"""
-        # Collect line groups with block separation
-        all_block_groups = []
+        has_sections = False
         page_number = None
         
+        # Loop-invariant lookups bound once per conversion
+        page_number_block_types = self.rules.page_number_block_types
+        textline_tag = self._textline_tag
+        string_tag = self._string_tag
+        get_compiled_line = self.rule_engine.get_compiled_line
+        process_line = self._process_line_to_markdown_simple
+        
         # Process each page
-        for page in alto_root.findall('.//alto:Page', self.alto_ns):
+        for blocks, line_types in pages:
             page_content = []
             
             # Process textblocks
-            for textblock in page.findall('.//alto:TextBlock', self.alto_ns):
-                block_type = self.tei_converter.get_block_type(textblock, tags_mapping)
-                
+            for textblock, block_type in blocks:
                 # Handle page number extraction
-                if self.rule_engine.should_extract_page_number(block_type):
-                    page_number = self.tei_converter.extract_page_number(textblock)
-                    continue
-                
-                # Skip non-content blocks
-                if not self.rule_engine.should_process_block(block_type):
+                if block_type in page_number_block_types:
+                    page_number = self._extract_page_number(textblock)
                     continue
                 
                 # Collect lines within this specific textblock
@@ -239,8 +522,8 @@ class AltoToMarkdownConverter:
                 current_paragraph_id = None  # Track current paragraph for continuation
                 
                 # Process textlines within this textblock
-                for textline in textblock.findall('.//alto:TextLine', self.alto_ns):
-                    string_elem = textline.find('alto:String', self.alto_ns)
+                for textline in textblock.iterfind(textline_tag):
+                    string_elem = textline.find(string_tag)
                     if string_elem is None:
                         continue
 
@@ -249,20 +532,20 @@ class AltoToMarkdownConverter:
                         continue
 
                     # Get line type and markdown mapping
-                    line_type = self.tei_converter.get_line_type(textline, tags_mapping)
+                    line_type = line_types[textline.get('TAGREFS', '')]
 
                     # Special handling: if line is in NumberingZone, treat as PageNumberLine
                     if block_type == "NumberingZone":
                         line_type = "PageNumberLine"
 
-                    line_config = self.rule_engine.get_line_mapping(line_type)
+                    line_config = get_compiled_line(line_type)
 
                     # Skip lines marked for skipping
-                    if line_config.get('markdown_format') == 'skip':
+                    if line_config.markdown_format == 'skip':
                         continue
 
                     # Get paragraph type, but also consider block type for zone separation
-                    paragraph_type = line_config.get('paragraph_type', 'default')
+                    paragraph_type = line_config.paragraph_type
 
                     # Special handling for paragraph_start: starts new paragraph, DefaultLine continues it
                     if paragraph_type == 'paragraph_start':
@@ -280,136 +563,87 @@ class AltoToMarkdownConverter:
                         if paragraph_type not in ['paragraph', 'paragraph_start']:
                             current_paragraph_id = None
 
-                    # Process line to markdown
-                    markdown_line = self._process_line_to_markdown_simple(text_content, line_config)
+                    # Prepare the line text; templates and escaping are applied after merging
+                    line_text = process_line(text_content, line_config)
                     
-                    if markdown_line:  # Only add non-empty lines
-                        block_line_groups.append((paragraph_type_with_block, markdown_line))
+                    if line_text:  # Only add non-empty lines
+                        block_line_groups.append((paragraph_type_with_block, line_text, line_config))
 
                 # Process this block's lines and add to page content
                 if block_line_groups:
                     block_merged_paragraphs = self._merge_line_groups(block_line_groups)
                     page_content.extend(block_merged_paragraphs)
 
-            # Add page break if configured and we have content
-            if page_content and self.rule_engine.should_include_page_breaks() and page_number:
-                page_break = self.rule_engine.get_page_break_template().format(page_number=page_number)
-                all_block_groups.append(page_break + '\n'.join(page_content))
-            elif page_content:
-                all_block_groups.append('\n'.join(page_content))
-
-        # Join all pages with appropriate separation
-        return self.rule_engine.get_paragraph_separator().join(all_block_groups)
-    
-    def _process_line_to_markdown(self, text: str, config: Dict, current_paragraph: List[str],
-                                current_container: str, container_lines: List[str], 
-                                page_content: List[str]) -> Optional[Tuple]:
-        """Process a single line to markdown format"""
-        
-        template = config.get('template', '{text}')
-        markdown_format = config.get('markdown_format', 'paragraph')
-        
-        # Handle standalone elements
-        if config.get('standalone'):
-            # Finalize current paragraph if exists
-            if current_paragraph:
-                page_content.append(' '.join(current_paragraph))
-                current_paragraph = []
-            
-            # Finalize current container if exists
-            if current_container and container_lines:
-                page_content.append('\n'.join(container_lines))
-                container_lines = []
-                current_container = None
-            
-            # Add standalone element
-            if markdown_format == 'divider':
-                page_content.append(template)  # Don't format dividers with text
-            else:
-                page_content.append(template.format(text=text))
-            
-            return current_paragraph, current_container, container_lines
-        
-        # Handle container elements (like poetry)
-        if config.get('container'):
-            container_type = config['container']
-            
-            # If switching containers, finalize previous
-            if current_container and current_container != container_type:
-                if container_lines:
-                    page_content.append('\n'.join(container_lines))
-                container_lines = []
-            
-            # Add to container
-            current_container = container_type
-            container_lines.append(template.format(text=text))
-            
-            return current_paragraph, current_container, container_lines
-        
-        # Handle paragraph elements
-        if config.get('add_to_paragraph') or config.get('starts_paragraph'):
-            # If starting new paragraph, finalize previous
-            if config.get('starts_paragraph') and current_paragraph:
-                page_content.append(' '.join(current_paragraph))
-                current_paragraph = []
-            
-            # Add to current paragraph
-            current_paragraph.append(template.format(text=text))
-            
-            return current_paragraph, current_container, container_lines
-        
-        # Default: treat as standalone
-        if current_paragraph:
-            page_content.append(' '.join(current_paragraph))
-            current_paragraph = []
+            has_sections = self._write_page(out, page_content, page_number, has_sections)
+    
+    def _write_page(self, out: TextIO, page_content: List[str], page_number: Optional[str],
+                    has_sections: bool) -> bool:
+        """Write one page section to the stream; return whether any section has been written"""
+        if not page_content:
+            return has_sections
+        
+        # Assemble the whole section so each page costs a single write() call
+        parts = []
+        
+        # Separate from the previous page section
+        if has_sections:
+            parts.append(self.rules.paragraph_separator)
+        
+        # Add page break if configured
+        if self.rules.include_page_breaks and page_number:
+            parts.append(self.rules.page_break_template.format(page_number=page_number))
+        
+        parts.append('\n'.join(page_content))
+        out.write(''.join(parts))
+        return True
+    
+    def _process_line_to_markdown(self, text: str, config: CompiledLineConfig, builder: '_PageBuilder') -> None:
+        """Process a single line to markdown format, updating the page builder in place"""
+        if config.normalize:
+            text = normalize_line_text(text)
+        if self.rules.escape_markdown:
+            text = text.translate(MARKDOWN_ESCAPE_TABLE)
+        if config.identity_template:
+            rendered = text
+        elif config.render is None:
+            rendered = config.prefix + text + config.suffix
+        else:
+            rendered = config.render(text)
         
-        page_content.append(template.format(text=text))
-        return current_paragraph, current_container, container_lines
+        config.emit(builder, rendered)
     
-    def _process_line_to_markdown_simple(self, text: str, config: Dict) -> Optional[str]:
-        """Process a single line to markdown format (simplified for merging)"""
-        
-        markdown_format = config.get('markdown_format', 'paragraph')
-        template = config.get('template', '{text}')
+    def _process_line_to_markdown_simple(self, text: str, config: CompiledLineConfig) -> Optional[str]:
+        """Prepare a single line's text for merging (simplified, without template)"""
         
         # Skip lines marked for skipping (like dividers)
-        if markdown_format == 'skip':
+        if config.markdown_format == 'skip':
             return None
         
-        # For markdown output, apply the template
-        return template.format(text=text)
+        if config.normalize:
+            text = normalize_line_text(text)
+        return text
+    
+    def _render_line(self, text: str, config: CompiledLineConfig) -> str:
+        """Escape line text if configured and apply the line type's template"""
+        if self.rules.escape_markdown:
+            text = text.translate(MARKDOWN_ESCAPE_TABLE)
+        if config.identity_template:
+            return text
+        if config.render is None:
+            return config.prefix + text + config.suffix
+        return config.render(text)
     
     def _merge_line_groups(self, line_groups) -> list:
         """Group consecutive lines of same type and merge them"""
-        if not line_groups:
-            return []
-        
         merged_paragraphs = []
-        current_group = []
-        current_type = None
-        
-        for paragraph_type, markdown_line in line_groups:
-            # If type changes, finalize current group
-            if current_type is not None and current_type != paragraph_type:
-                if current_group:
-                    merged_text = self._merge_lines_in_group(current_group, current_type)
-                    if merged_text:
-                        merged_paragraphs.append(merged_text)
-                current_group = []
-            
-            current_type = paragraph_type
-            current_group.append(markdown_line)
-        
-        # Finalize last group
-        if current_group and current_type:
-            merged_text = self._merge_lines_in_group(current_group, current_type)
+        for paragraph_type, group in groupby(line_groups, key=itemgetter(0)):
+            merged_text = self._merge_lines_in_group([(text, config) for _, text, config in group], paragraph_type)
             if merged_text:
                 merged_paragraphs.append(merged_text)
-        
         return merged_paragraphs
     
     def _merge_lines_in_group(self, lines: list, paragraph_type: str) -> str:
-        """Merge lines within a group, handling hyphenation"""
+        """Merge (text, config) lines within a group, handling hyphenation"""
         if not lines:
             return ""
         
@@ -421,88 +655,58 @@ class AltoToMarkdownConverter:
             base_type = 'paragraph'
         
         # Check if this paragraph type should be merged
-        if base_type == "paragraph" and not self.rule_engine.should_merge_paragraph_lines():
-            return '\n'.join(lines)
-        elif base_type == "verse" and not self.rule_engine.should_merge_verse_lines():
-            return '\n'.join(lines)
-        elif base_type not in ["paragraph", "verse"]:
+        if ((base_type == "paragraph" and not self.rules.merge_paragraph_lines)
+                or (base_type == "verse" and not self.rules.merge_verse_lines)
+                or base_type not in ["paragraph", "verse"]):
             # For speakers, stage directions, etc., keep them separate
-            return '\n'.join(lines)
+            return '\n'.join(self._render_line(text, config) for text, config in lines)
         
-        # Handle hyphenation if enabled
-        if self.rule_engine.should_handle_hyphenation():
+        # Handle hyphenation on the raw text, so escaping can't hide a trailing hyphen
+        if self.rules.handle_hyphenation:
             lines = self._handle_hyphenation(lines)
         
         # Join with appropriate separator
-        joiner = self.rule_engine.get_line_joiner()
-        return joiner.join(lines)
+        joiner = self.rules.line_joiner
+        return joiner.join(self._render_line(text, config) for text, config in lines)
     
     def _handle_hyphenation(self, lines: list) -> list:
-        """Handle hyphenation by joining hyphenated words across lines"""
+        """Handle hyphenation by joining hyphenated words across (text, config) lines
+        
+        A single left-to-right pass is enough: joining only ever extends the
+        last output line, whose hyphenation status is then re-checked against
+        the next line. A joined line keeps the config of its first part.
+        """
         
         if len(lines) <= 1:
             return lines
         
-        patterns = self.rule_engine.get_hyphen_patterns()
-        word_break_chars = self.rule_engine.get_word_break_chars()
-        
-        # Run hyphenation handling in a loop until no more changes
-        current_lines = lines[:]
-        max_iterations = 10  # Prevent infinite loops
-        iteration = 0
+        find_hyphen = self.rules.find_hyphen
+        word_break_chars = self.rules.word_break_chars
+        single_char_breaks = all(len(char) == 1 for char in word_break_chars)
         
-        while iteration < max_iterations:
-            processed_lines = []
-            i = 0
-            changes_made = False
-            
-            while i < len(current_lines):
-                current_line = current_lines[i]
-                
-                # Check if current line ends with hyphenation
-                is_hyphenated = False
-                for pattern in patterns:
-                    if re.search(pattern, current_line):
-                        is_hyphenated = True
-                        break
+        merged_lines = []
+        for line, config in lines:
+            match = find_hyphen(merged_lines[-1][0]) if merged_lines else None
+            if match:
+                previous_line, previous_config = merged_lines[-1]
                 
-                if is_hyphenated and i + 1 < len(current_lines):
-                    # Remove hyphenation character(s) from end of current line
+                # Remove hyphenation character(s) from end of previous line. When the
+                # pattern matched exactly one word-break char at the end, cut at the match.
+                if (single_char_breaks and match.end() == len(previous_line)
+                        and match.group() in word_break_chars):
+                    previous_line = previous_line[:match.start()]
+                elif previous_line.endswith(word_break_chars):
                     for char in word_break_chars:
-                        if current_line.endswith(char):
-                            current_line = current_line[:-len(char)]
+                        if previous_line.endswith(char):
+                            previous_line = previous_line[:-len(char)]
                             break
-                    
-                    # Join with next line (no space for hyphenated words)
-                    next_line = current_lines[i + 1]
-                    merged_line = current_line + next_line
-                    processed_lines.append(merged_line)
-                    i += 2  # Skip next line since we merged it
-                    changes_made = True
-                else:
-                    processed_lines.append(current_line)
-                    i += 1
-            
-            current_lines = processed_lines
-            iteration += 1
-            
-            # If no changes were made, we're done
-            if not changes_made:
-                break
-        
-        return current_lines
-    
-    def _finalize_page_content(self, current_paragraph: List[str], current_container: str,
-                             container_lines: List[str], page_content: List[str]) -> None:
-        """Finalize any remaining content at end of page"""
-        
-        # Finalize paragraph
-        if current_paragraph:
-            page_content.append(' '.join(current_paragraph))
+                
+                # Join with this line (no space for hyphenated words)
+                merged_lines[-1] = (previous_line + line, previous_config)
+            else:
+                merged_lines.append((line, config))
         
-        # Finalize container
-        if current_container and container_lines:
-            page_content.append('\n'.join(container_lines))
+        return merged_lines
     
     def save_markdown(self, markdown_content: str, output_file: Path) -> None:
         """Save Markdown content to file"""
@@ -510,7 +714,7 @@ class AltoToMarkdownConverter:
             f.write(markdown_content)
     
     def process_all_alto_files(self, input_folder: str, output_folder: str, 
-                             suffix: str = "_md") -> None:
+                             suffix: str = "_md", jobs: Optional[int] = None) -> None:
         """Process all ALTO files in a folder and convert to Markdown"""
         
         input_path = Path(input_folder)
@@ -519,8 +723,12 @@ class AltoToMarkdownConverter:
         # Create output directory if it doesn't exist
         output_path.mkdir(parents=True, exist_ok=True)
         
-        # Find all ALTO XML files
-        alto_files = list(input_path.glob("*.xml"))
+        # Find all ALTO XML files (one scandir pass, no per-entry stat for the pattern match)
+        alto_files = []
+        if input_path.is_dir():
+            with os.scandir(input_path) as entries:
+                alto_files = [Path(entry.path) for entry in entries
+                              if entry.name.endswith('.xml') and entry.is_file()]
         
         if not alto_files:
             print(f"No XML files found in {input_folder}")
@@ -528,24 +736,68 @@ class AltoToMarkdownConverter:
         
         print(f"Converting {len(alto_files)} ALTO files to Markdown...")
         
-        for alto_file in alto_files:
-            try:
-                # Convert to markdown
-                markdown_content = self.convert_alto_to_markdown(alto_file)
-                
-                # Create output filename
-                output_filename = alto_file.stem + suffix + ".md"
-                output_file = output_path / output_filename
-                
-                # Save markdown
-                self.save_markdown(markdown_content, output_file)
-                
-                print(f"✅ {alto_file.name} → {output_filename}")
-                
-            except Exception as e:
-                print(f"❌ Error converting {alto_file.name}: {e}")
+        tasks = [(alto_file, output_path, suffix) for alto_file in alto_files]
+        
+        # Small batches aren't worth the process start-up cost
+        if jobs == 1 or len(tasks) < PARALLEL_MIN_FILES:
+            for task in tasks:
+                self._report_result(self._convert_task(task))
+        else:
+            # Files are independent, so convert them in worker processes
+            with ProcessPoolExecutor(max_workers=jobs or os.cpu_count(),
+                                     initializer=_init_worker,
+                                     initargs=(self.config_path, self.merge_lines)) as executor:
+                for result in executor.map(_convert_one, tasks, chunksize=8):
+                    self._report_result(result)
         
         print(f"Conversion complete! Markdown files saved to {output_folder}")
+    
+    def _convert_task(self, task: Tuple[Path, Path, str]) -> Tuple[str, Optional[str], Optional[str]]:
+        """Convert one (alto_file, output_path, suffix) task; return (name, output filename, error)"""
+        alto_file, output_path, suffix = task
+        try:
+            return alto_file.name, self.convert_file(alto_file, output_path, suffix), None
+        except Exception as e:
+            return alto_file.name, None, str(e)
+    
+    @staticmethod
+    def _report_result(result: Tuple[str, Optional[str], Optional[str]]) -> None:
+        """Print the outcome of one file conversion"""
+        name, output_filename, error = result
+        if error is None:
+            print(f"✅ {name} → {output_filename}")
+        else:
+            print(f"❌ Error converting {name}: {error}")
+    
+    def convert_file(self, alto_file: Path, output_path: Path, suffix: str = "_md") -> str:
+        """Convert a single ALTO file and save it; return the output filename"""
+        # Create output filename
+        output_filename = alto_file.stem + suffix + ".md"
+        output_file = output_path / output_filename
+        
+        # Stream pages straight to disk; don't leave a truncated file behind on failure
+        try:
+            with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                self.write_markdown(alto_file, f)
+        except Exception:
+            output_file.unlink(missing_ok=True)
+            raise
+        return output_filename
+
+# Below this many files process_all_alto_files converts serially
+PARALLEL_MIN_FILES = 4
+
+# Per-process converter used by process_all_alto_files workers
+_worker_converter: Optional[AltoToMarkdownConverter] = None
+
+def _init_worker(config_path: str, merge_lines: bool) -> None:
+    """Build the converter once per worker process"""
+    global _worker_converter
+    _worker_converter = AltoToMarkdownConverter(config_path, merge_lines=merge_lines)
+
+def _convert_one(task: Tuple[Path, Path, str]) -> Tuple[str, Optional[str], Optional[str]]:
+    """Convert one ALTO file in a worker; return (name, output filename, error)"""
+    return _worker_converter._convert_task(task)
 
 def main():
     """Command-line interface for ALTO to Markdown conversion"""
@@ -569,6 +821,8 @@ def main():
                        help='Path to YAML configuration file')
     parser.add_argument('--merge-lines', '-m', action='store_true',
                        help='Merge lines within paragraphs and handle hyphenation')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                       help='Number of worker processes (default: number of CPUs)')
     
     args = parser.parse_args()
     
@@ -585,7 +839,7 @@ def main():
     
     try:
         converter = AltoToMarkdownConverter(args.config, merge_lines=args.merge_lines)
-        converter.process_all_alto_files(input_folder, output_folder, args.suffix)
+        converter.process_all_alto_files(input_folder, output_folder, args.suffix, jobs=args.jobs)
     except Exception as e:
         print(f"❌ Error: {e}")
         return 1
@@ -5,12 +5,109 @@ Convert eScriptorium ALTO XML output to TEI format
 
 import xml.etree.ElementTree as ET
 import glob
+import io
 import os
 import re
+import sys
 import argparse
+import copy
+import threading
+import time
 import yaml
+import zipfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, NamedTuple, Optional, TextIO, Tuple, Any
+
+# Fallback for footnotes that start with symbol-like characters
+FOOTNOTE_SYMBOL_PATTERN = re.compile(r'^[^\w\s]+\s*')
+
+# Whitespace that puts preserved <lb /> elements and the text after them on their own lines
+LB_INDENT = '\n      '
+
+# Levels of the TEI tree written tag by tag; deeper subtrees are serialized whole, except
+# that a sole child is always followed down, so lone wrappers like a book's page div are streamed too
+TEI_STREAM_DEPTH = 3
+
+# Buffer size for ALTO reads and TEI writes, so each file takes a few large syscalls
+IO_BUFFER_SIZE = 1 << 20
+
+# Seconds between writes of batched per-file progress lines
+PROGRESS_FLUSH_INTERVAL = 0.05
+
+# Bytes peeked from each input file, and the root start tag after any XML declaration/PIs
+ROOT_SNIFF_SIZE = 4096
+ROOT_START_TAG_PATTERN = re.compile(rb'(?:\xef\xbb\xbf)?(?:\s*<\?.*?\?>)*\s*<[^\s/>!?](?:[^>"\']|"[^"]*"|\'[^\']*\')*>', re.DOTALL)
+
+class BlockFlags(NamedTuple):
+    """Per-block-type processing flags resolved once from the YAML config"""
+    process_lines: Any
+    skip_content: Any
+    extract_page_number: Any
+    extract_footnote: Any
+    has_tei_element: bool
+
+# Flags for block types missing from the configuration
+DEFAULT_BLOCK_FLAGS = BlockFlags(False, False, False, False, False)
+
+def combine_patterns(compiled_patterns: List[re.Pattern]) -> Optional[re.Pattern]:
+    """Join compiled patterns into one alternation, tried in the given order
+    
+    Returns None when the patterns should be tried one by one instead: capturing
+    groups (and backreferences to them) would be renumbered in the alternation,
+    and inline flags like '(?i)' are rejected in the middle of a pattern.
+    """
+    if not compiled_patterns or any(p.groups for p in compiled_patterns):
+        return None
+    try:
+        return re.compile('|'.join(f'(?:{p.pattern})' for p in compiled_patterns))
+    except re.error:
+        return None
+
+@dataclass(slots=True)
+class FileResult:
+    """Per-file conversion outcome and metadata (page number, poetry, footnotes)"""
+    skipped: bool = False
+    reason: Optional[str] = None
+    output_file: Optional[str] = None
+    page_number: Optional[str] = None
+    has_poetry: bool = False
+    poetry_line_count: int = 0
+    footnote_count: int = 0
+    footnote_symbols: List[str] = field(default_factory=list)
+    tei_bytes: Optional[bytes] = None  # TEI kept in memory for aggregate output
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Page and content metadata as a plain dict, in the extract_metadata_from_tree format"""
+        return {
+            'page_number': self.page_number,
+            'has_poetry': self.has_poetry,
+            'poetry_line_count': self.poetry_line_count,
+            'footnote_count': self.footnote_count,
+            'footnote_symbols': list(self.footnote_symbols)
+        }
+
+# Parsed configurations shared by every loader in the process:
+# resolved path -> (mtime, size, config), evicted least recently used first
+_YAML_CACHE: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_LOCK = threading.Lock()
+_YAML_CACHE_SIZE = 100
+
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_yaml_loader_warned = False
+
+def _get_yaml_loader():
+    """Return the fastest safe YAML loader, warning once if libyaml is unavailable"""
+    global _yaml_loader_warned
+    if _YAML_LOADER is yaml.SafeLoader and not _yaml_loader_warned:
+        _yaml_loader_warned = True
+        print("⚠️  Warning: PyYAML was built without libyaml; configuration parsing "
+              "falls back to the slower pure-Python SafeLoader")
+    return _YAML_LOADER
 
 class ConfigurationLoader:
     """Loads and manages ALTO-TEI transformation rules from YAML configuration"""
@@ -20,14 +117,35 @@ class ConfigurationLoader:
         self.config = self._load_config()
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load YAML configuration file"""
+        """Load YAML configuration file, reusing the parsed result while the file is unchanged
+        
+        Each loader gets its own copy, so rule engines can change their settings in place.
+        """
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            st = os.stat(self.config_path)
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
-        except yaml.YAMLError as e:
-            raise ValueError(f"Error parsing YAML configuration: {e}")
+        cache_key = str(self.config_path.resolve())
+        
+        with _YAML_CACHE_LOCK:
+            cached = _YAML_CACHE.get(cache_key)
+            if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+                _YAML_CACHE.move_to_end(cache_key)
+                return copy.deepcopy(cached[2])
+            
+            try:
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    config = yaml.load(f, Loader=_get_yaml_loader())
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
+            except yaml.YAMLError as e:
+                raise ValueError(f"Error parsing YAML configuration: {e}")
+            
+            _YAML_CACHE[cache_key] = (st.st_mtime, st.st_size, config)
+            _YAML_CACHE.move_to_end(cache_key)
+            if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+                _YAML_CACHE.popitem(last=False)
+        return copy.deepcopy(config)
     
     def get_block_types(self) -> Dict[str, Dict[str, Any]]:
         """Get block type configuration"""
@@ -50,23 +168,60 @@ class ConfigurationLoader:
         """Get element creation configuration"""
         return self.config.get('element_creation', {})
 
+def _intern_keys(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a config mapping with its string keys interned"""
+    if not isinstance(mapping, dict):
+        return mapping
+    return {sys.intern(key) if isinstance(key, str) else key: value for key, value in mapping.items()}
+
 class RuleEngine:
     """Processes YAML-based rules for ALTO to TEI conversion"""
     
     def __init__(self, config_loader: ConfigurationLoader):
         self.config = config_loader
-        self.block_types = config_loader.get_block_types()
-        self.line_types = config_loader.get_line_types()
+        # Interned names make lookups with interned ALTO tag labels an identity match
+        self.block_types = _intern_keys(config_loader.get_block_types())
+        self.line_types = _intern_keys(config_loader.get_line_types())
         self.footnote_patterns = [item['pattern'] for item in config_loader.get_footnote_patterns()]
+        self._compiled_footnote_patterns = [re.compile(pattern) for pattern in self.footnote_patterns]
+        self._combined_footnote_pattern = self._combine_footnote_patterns()
         self.tei_structure = config_loader.get_tei_structure()
         
+        # Resolve the per-block flags checked for every block up front
+        self._block_flags = {
+            block_type: BlockFlags(
+                block_config.get('process_lines', False),
+                block_config.get('skip_content', False),
+                block_config.get('extract_page_number', False),
+                block_config.get('extract_footnote', False),
+                'tei_element' in block_config
+            )
+            for block_type, block_config in self.block_types.items()
+            if isinstance(block_config, dict)  # malformed entries are reported by validation
+        }
+        self._default_line_mapping = self.line_types.get('DefaultLine', {})
+        
+        # Legacy-format line mappings, converted once per configured line type
+        self._legacy_line_mappings = {
+            line_type: self._build_legacy_line_mapping(line_type)
+            for line_type, line_config in self.line_types.items()
+            if isinstance(line_config, dict)
+        }
+        self._default_legacy_line_mapping = self._build_legacy_line_mapping(None)
+        
+        # should_skip_element results per (tag, namespace); pages reuse a handful of tags
+        self._skip_element_cache: Dict[Tuple[str, Optional[str]], bool] = {}
+        
         # Validate configuration
         self._validate_configuration()
     
+    def get_block_flags(self, block_type: str) -> BlockFlags:
+        """Get the precomputed processing flags for a block type"""
+        return self._block_flags.get(block_type, DEFAULT_BLOCK_FLAGS)
+    
     def should_process_block(self, block_type: str) -> bool:
         """Check if a block type should be processed for content"""
-        block_config = self.block_types.get(block_type, {})
-        return block_config.get('process_lines', False)
+        return self._block_flags.get(block_type, DEFAULT_BLOCK_FLAGS).process_lines
     
     def get_special_lines_to_process(self, block_type: str) -> List[str]:
         """Get list of special line types to process even in non-processing blocks"""
@@ -80,31 +235,64 @@ class RuleEngine:
     
     def should_skip_block(self, block_type: str) -> bool:
         """Check if a block type should be skipped entirely"""
-        block_config = self.block_types.get(block_type, {})
-        return block_config.get('skip_content', False)
+        return self._block_flags.get(block_type, DEFAULT_BLOCK_FLAGS).skip_content
     
     def should_extract_page_number(self, block_type: str) -> bool:
         """Check if page number should be extracted from this block type"""
-        block_config = self.block_types.get(block_type, {})
-        return block_config.get('extract_page_number', False)
+        return self._block_flags.get(block_type, DEFAULT_BLOCK_FLAGS).extract_page_number
     
     def should_extract_footnote(self, block_type: str) -> bool:
         """Check if footnote should be extracted from this block type"""
-        block_config = self.block_types.get(block_type, {})
-        return block_config.get('extract_footnote', False)
+        return self._block_flags.get(block_type, DEFAULT_BLOCK_FLAGS).extract_footnote
     
     def should_create_block_element(self, block_type: str) -> bool:
         """Check if block should be converted to a single TEI element"""
-        block_config = self.block_types.get(block_type, {})
-        return 'tei_element' in block_config
+        return self._block_flags.get(block_type, DEFAULT_BLOCK_FLAGS).has_tei_element
     
     def get_footnote_patterns(self) -> List[str]:
         """Get list of footnote patterns for matching"""
         return self.footnote_patterns
     
+    def _combine_footnote_patterns(self) -> Optional[re.Pattern]:
+        """Join the footnote patterns into one alternation, tried in configured order"""
+        return combine_patterns(self._compiled_footnote_patterns)
+    
+    def match_footnote_symbol(self, footnote_text: str) -> Optional[re.Match]:
+        """Match the first configured footnote pattern at the start of the text"""
+        if self._combined_footnote_pattern is not None:
+            return self._combined_footnote_pattern.match(footnote_text)
+        for pattern in self._compiled_footnote_patterns:
+            match = pattern.match(footnote_text)
+            if match:
+                return match
+        return None
+    
     def get_line_mapping(self, line_type: str) -> Dict[str, Any]:
         """Get TEI mapping configuration for a line type"""
-        return self.line_types.get(line_type, self.line_types.get('DefaultLine', {}))
+        return self.line_types.get(line_type, self._default_line_mapping)
+    
+    def get_legacy_line_mapping(self, line_type: str) -> Dict[str, Any]:
+        """Get the precomputed legacy-format mapping for a line type (shared; do not modify)"""
+        return self._legacy_line_mappings.get(line_type, self._default_legacy_line_mapping)
+    
+    def _build_legacy_line_mapping(self, line_type: Optional[str]) -> Dict[str, Any]:
+        """Convert a line type's YAML mapping into the legacy mapping format"""
+        yaml_mapping = self.get_line_mapping(line_type)
+        # Convert YAML format to legacy format for compatibility
+        if yaml_mapping:
+            legacy_mapping = {
+                'element': yaml_mapping.get('tei_element', 'p'),
+                'rend': yaml_mapping.get('attributes', {}).get('rend', 'default'),
+                'action': yaml_mapping.get('action', 'create_element'),
+                'container': yaml_mapping.get('container'),
+                'container_attributes': yaml_mapping.get('container_attributes', {}),
+                'closes': yaml_mapping.get('closes', []),
+                'standalone': yaml_mapping.get('standalone', False)
+            }
+            return legacy_mapping
+        else:
+            # Fallback for unknown line types
+            return {'element': 'p', 'rend': 'default', 'action': 'create_element'}
     
     
     def get_tei_namespace(self) -> str:
@@ -131,43 +319,39 @@ class RuleEngine:
                 element.text = content
             return element
         
-        # Create the main element
-        element = ET.Element(config['element'])
-        
-        # Set content if provided
-        if content:
-            element.text = content
-        
-        # Set attributes from config
+        # Collect attributes first so the element is built in one call
         attributes = config.get('attributes', {})
         default_attributes = config.get('default_attributes', {})
         
-        # First set default attributes
-        for attr_name, attr_value in default_attributes.items():
-            element.set(attr_name, attr_value)
-        
-        # Then set specific attributes (which can override defaults)
+        # Start from default attributes; specific attributes can override them
+        attrib = dict(default_attributes)
         for attr_name, attr_value in attributes.items():
             # Handle dynamic attribute values
             if attr_name == 'n' and 'symbol' in kwargs:
-                element.set(attr_name, kwargs['symbol'])
+                attrib[attr_name] = kwargs['symbol']
             elif attr_name == 'n' and 'page_number' in kwargs:
-                element.set(attr_name, kwargs['page_number'])
+                attrib[attr_name] = kwargs['page_number']
             elif attr_name == 'facs' and 'source_image' in kwargs:
-                element.set(attr_name, kwargs['source_image'])
+                attrib[attr_name] = kwargs['source_image']
             elif attr_name == 'facs' and 'facs_reference' in kwargs:
-                element.set(attr_name, kwargs['facs_reference'])
+                attrib[attr_name] = kwargs['facs_reference']
             elif attr_name == 'type' and 'line_type' in kwargs and element_type == 'form_work':
                 # Handle form work type mappings
                 type_mappings = config.get('type_mappings', {})
-                mapped_type = type_mappings.get(kwargs['line_type'], type_mappings.get('default', 'other'))
-                element.set(attr_name, mapped_type)
+                attrib[attr_name] = type_mappings.get(kwargs['line_type'], type_mappings.get('default', 'other'))
             else:
-                element.set(attr_name, attr_value)
+                attrib[attr_name] = attr_value
         
         # Handle additional kwargs that might override attributes
         if 'rend' in kwargs and kwargs['rend'] != 'header':
-            element.set('rend', kwargs['rend'])
+            attrib['rend'] = kwargs['rend']
+        
+        # Create the main element
+        element = ET.Element(config['element'], attrib)
+        
+        # Set content if provided
+        if content:
+            element.text = content
         
         return element
     
@@ -263,6 +447,14 @@ class RuleEngine:
     
     def should_skip_element(self, element_tag: str, namespace: str = None) -> bool:
         """Check if an element should be skipped during processing"""
+        key = (element_tag, namespace)
+        skip = self._skip_element_cache.get(key)
+        if skip is None:
+            skip = self._skip_element_cache[key] = self._should_skip_element_uncached(element_tag, namespace)
+        return skip
+    
+    def _should_skip_element_uncached(self, element_tag: str, namespace: Optional[str]) -> bool:
+        """Match a tag against the configured skip_elements, plain or namespace-qualified"""
         skip_elements = self.get_skip_elements()
         
         # Check direct tag name
@@ -340,41 +532,95 @@ class AltoToTeiConverter:
         # ALTO namespace
         self.alto_ns = {'alto': 'http://www.loc.gov/standards/alto/ns-v4#'}
         
+        # Namespace-qualified tags matched while streaming ALTO files
+        alto_uri = self.alto_ns['alto']
+        self._tags_tag = f'{{{alto_uri}}}Tags'
+        self._filename_tag = f'{{{alto_uri}}}fileName'
+        self._textblock_tag = f'{{{alto_uri}}}TextBlock'
+        self._textline_tag = f'{{{alto_uri}}}TextLine'
+        self._string_tag = f'{{{alto_uri}}}String'
+        self._other_tag_tag = f'{{{alto_uri}}}OtherTag'
+        
+        # Prebuilt Clark-notation paths, so find() skips prefix expansion
+        self._tags_path = f'.//{self._tags_tag}'
+        self._filename_path = f'.//{{{alto_uri}}}sourceImageInformation/{self._filename_tag}'
+        
+        # Kept so worker processes can rebuild an identical converter
+        self.config_path = config_path
+        self.preserve_line_breaks = preserve_line_breaks
+        
         # Load configuration and rule engine
         self.config_loader = ConfigurationLoader(config_path)
         self.rule_engine = RuleEngine(self.config_loader)
         self.tei_ns = self.rule_engine.get_tei_namespace()
         
+        # Resolved TAGREFS for the file being converted (None outside a conversion)
+        self._resolve_cache: Optional[Dict[Tuple[str, str, Optional[str]], str]] = None
+        
         # Override line break preservation if specified
         if preserve_line_breaks is not None:
             self.rule_engine.tei_structure['body']['preserve_line_breaks'] = preserve_line_breaks
     
-    
     def parse_alto_tags(self, alto_root: ET.Element) -> Dict[str, str]:
         """Parse ALTO tags section to get type mappings"""
+        tags_section = alto_root.find(self._tags_path)
+        if tags_section is None:
+            return {}
+        return self.parse_tags_section(tags_section)
+    
+    def parse_tags_section(self, tags_section: ET.Element) -> Dict[str, str]:
+        """Get type mappings from an already located ALTO Tags element"""
         tags = {}
-        tags_section = alto_root.find('.//alto:Tags', self.alto_ns)
-        if tags_section is not None:
-            for tag in tags_section.findall('alto:OtherTag', self.alto_ns):
-                tag_id = tag.get('ID')
-                label = tag.get('LABEL')
-                if tag_id and label:
-                    tags[tag_id] = label
+        for tag in tags_section.iterfind(self._other_tag_tag):
+            tag_id = tag.get('ID')
+            label = tag.get('LABEL')
+            if tag_id and label:
+                tags[tag_id] = sys.intern(label)
         return tags
     
     def resolve_tag_type(self, element: ET.Element, tags_mapping: Dict[str, str], tag_prefix: str, default: str = None) -> str:
         """Unified method to resolve tag type from TAGREFS for both blocks and lines"""
-        tagrefs = element.get('TAGREFS', '')
+        return self.resolve_tagrefs(element.get('TAGREFS', ''), tags_mapping, tag_prefix, default)
+    
+    def resolve_tagrefs(self, tagrefs: str, tags_mapping: Dict[str, str], tag_prefix: str, default: str = None) -> str:
+        """Resolve tag type from a raw TAGREFS attribute value"""
+        # Lines on a page share a handful of TAGREFS strings, so memoize while converting a file
+        cache = self._resolve_cache
+        if cache is None:
+            return self._resolve_tagrefs_uncached(tagrefs, tags_mapping, tag_prefix, default)
+        key = (tagrefs, tag_prefix, default)
+        tag_type = cache.get(key)
+        if tag_type is None:
+            tag_type = cache[key] = self._resolve_tagrefs_uncached(tagrefs, tags_mapping, tag_prefix, default)
+        return tag_type
+    
+    @contextmanager
+    def _tagrefs_memo(self) -> Iterator[None]:
+        """Memoize TAGREFS resolution for one file's conversion, starting empty (reentrant)"""
+        if self._resolve_cache is not None:
+            yield
+            return
+        self._resolve_cache = {}
+        try:
+            yield
+        finally:
+            self._resolve_cache = None
+    
+    def _resolve_tagrefs_uncached(self, tagrefs: str, tags_mapping: Dict[str, str], tag_prefix: str, default: str = None) -> str:
+        """Scan TAGREFS for the first reference with the given prefix"""
         if tagrefs:
-            for tagref in tagrefs.split():
-                if tagref.startswith(tag_prefix) and tagref in tags_mapping:
-                    tag_type = tags_mapping[tagref]
-                    # Check if this tag type exists in our config
-                    if tag_prefix == 'BT' and tag_type in self.rule_engine.block_types:
-                        return tag_type
-                    elif tag_prefix == 'LT' and tag_type in self.rule_engine.line_types:
+            # Most elements carry a single reference; only split when there is whitespace
+            # (isprintable() is False for every whitespace character except the plain space)
+            if ' ' in tagrefs or not tagrefs.isprintable():
+                tagref_list = tagrefs.split()
+            else:
+                tagref_list = (tagrefs,)
+            for tagref in tagref_list:
+                if tagref.startswith(tag_prefix):
+                    # Labels missing from our config are returned as-is; lookups fall back later
+                    tag_type = tags_mapping.get(tagref)
+                    if tag_type is not None:
                         return tag_type
-                    return tag_type
         return default or ('MainZone' if tag_prefix == 'BT' else 'DefaultLine')
     
     def get_block_type(self, textblock: ET.Element, tags_mapping: Dict[str, str]) -> str:
@@ -383,16 +629,17 @@ class AltoToTeiConverter:
     
     def _extract_text_from_strings(self, textblock: ET.Element) -> Optional[str]:
         """Extract and combine text content from all ALTO String elements in a block"""
-        strings = textblock.findall('.//alto:String', self.alto_ns)
-        if not strings:
-            return None
+        # Strings always sit directly under the block's TextLines
+        parts = []
+        append = parts.append
+        for textline in textblock.iterfind(self._textline_tag):
+            for string in textline.iterfind(self._string_tag):
+                content = string.get('CONTENT')
+                if content and not content.isspace():
+                    append(content)
         
         # Combine all string contents (in case text spans multiple strings)
-        text = ' '.join(
-            string.get('CONTENT', '') 
-            for string in strings 
-            if string.get('CONTENT', '').strip()
-        ).strip()
+        text = ' '.join(parts).strip()
         
         return text if text else None
     
@@ -401,7 +648,7 @@ class AltoToTeiConverter:
         page_text = self._extract_text_from_strings(textblock)
         
         # Basic validation - should be mostly numeric
-        if page_text and any(char.isdigit() for char in page_text):
+        if page_text and any(map(str.isdigit, page_text)):
             return page_text
         return None
     
@@ -416,20 +663,16 @@ class AltoToTeiConverter:
         symbol = None
         text = footnote_text
         
-        # Get patterns from rule engine
-        patterns = self.rule_engine.get_footnote_patterns()
-        
-        for pattern in patterns:
-            match = re.match(pattern, footnote_text)
-            if match:
-                symbol = match.group().strip()
-                text = footnote_text[match.end():].strip()
-                break
+        # Match the configured patterns in one call
+        match = self.rule_engine.match_footnote_symbol(footnote_text)
+        if match:
+            symbol = match.group().strip()
+            text = footnote_text[match.end():].strip()
         
         # If no pattern matched, try to detect common symbols at the start
         if symbol is None:
             # Look for any symbol-like characters at the beginning
-            symbol_match = re.match(r'^[^\w\s]+\s*', footnote_text)
+            symbol_match = FOOTNOTE_SYMBOL_PATTERN.match(footnote_text)
             if symbol_match:
                 symbol = symbol_match.group().strip()
                 text = footnote_text[symbol_match.end():].strip()
@@ -454,14 +697,9 @@ class AltoToTeiConverter:
         
         # Create the TEI element
         element_tag = block_config['tei_element']
-        element = ET.Element(element_tag)
+        element = ET.Element(element_tag, block_config.get('attributes', {}))
         element.text = block_text
         
-        # Set attributes from config
-        attributes = block_config.get('attributes', {})
-        for attr, value in attributes.items():
-            element.set(attr, value)
-        
         return element
     
     def create_footnote_element(self, footnote_content: Dict[str, str]) -> ET.Element:
@@ -480,25 +718,17 @@ class AltoToTeiConverter:
     
     def _get_line_mapping(self, line_type: str) -> Dict[str, Any]:
         """Get line mapping using rule engine"""
-        yaml_mapping = self.rule_engine.get_line_mapping(line_type)
-        # Convert YAML format to legacy format for compatibility
-        if yaml_mapping:
-            legacy_mapping = {
-                'element': yaml_mapping.get('tei_element', 'p'),
-                'rend': yaml_mapping.get('attributes', {}).get('rend', 'default'),
-                'action': yaml_mapping.get('action', 'create_element'),
-                'container': yaml_mapping.get('container'),
-                'container_attributes': yaml_mapping.get('container_attributes', {}),
-                'closes': yaml_mapping.get('closes', []),
-                'standalone': yaml_mapping.get('standalone', False)
-            }
-            return legacy_mapping
-        else:
-            # Fallback for unknown line types
-            return {'element': 'p', 'rend': 'default', 'action': 'create_element'}
+        return self.rule_engine.get_legacy_line_mapping(line_type)
     
     def create_tei_header(self, alto_root: ET.Element) -> ET.Element:
         """Create TEI header from ALTO metadata"""
+        # Try to get filename from ALTO
+        filename_elem = alto_root.find(self._filename_path)
+        return self._build_tei_header(filename_elem is not None, 
+                                      filename_elem.text if filename_elem is not None else None)
+    
+    def _build_tei_header(self, has_source_image: bool, source_image: Optional[str]) -> ET.Element:
+        """Create TEI header for an ALTO file with the given source image name"""
         header = ET.Element('teiHeader')
         
         # File description
@@ -506,10 +736,8 @@ class AltoToTeiConverter:
         title_stmt = ET.SubElement(file_desc, 'titleStmt')
         title = ET.SubElement(title_stmt, 'title')
         
-        # Try to get filename from ALTO
-        filename_elem = alto_root.find('.//alto:sourceImageInformation/alto:fileName', self.alto_ns)
-        if filename_elem is not None:
-            title.text = f"Digital text from {filename_elem.text}"
+        if has_source_image:
+            title.text = f"Digital text from {source_image}"
         else:
             title.text = "Digital text from eScriptorium"
         
@@ -538,10 +766,7 @@ class AltoToTeiConverter:
     def _ensure_container(self, state: Dict, container_type: str, container_config: Dict) -> None:
         """Ensure specified container exists in state"""
         if container_type == 'lg' and not state.get('current_lg'):
-            state['current_lg'] = ET.Element('lg')
-            # Set attributes from config
-            for attr, value in container_config.get('attributes', {}).items():
-                state['current_lg'].set(attr, value)
+            state['current_lg'] = ET.Element('lg', container_config.get('attributes', {}))
         elif container_type == 'p' and not state.get('current_p'):
             state['current_p'] = ET.Element('p')
     
@@ -595,15 +820,10 @@ class AltoToTeiConverter:
             # Create standalone element or element in container
             tei_element = line_config.get('tei_element', 'p')
             
-            # Create the element
-            element = ET.Element(tei_element)
+            # Create the element with its configured attributes
+            element = ET.Element(tei_element, line_config.get('attributes', {}))
             element.text = text_content
             
-            # Set attributes
-            attributes = line_config.get('attributes', {})
-            for attr, value in attributes.items():
-                element.set(attr, value)
-            
             # Handle container requirements
             container = line_config.get('container')
             if container:
@@ -625,12 +845,10 @@ class AltoToTeiConverter:
         elements = []
         state = {'current_p': None, 'current_lg': None}
         
-        # Get all textlines in this block
-        textlines = textblock.findall('.//alto:TextLine', self.alto_ns)
-        
-        for textline in textlines:
+        # Get all textlines in this block (direct children in ALTO)
+        for textline in textblock.iterfind(self._textline_tag):
             # Get the text content
-            string_elem = textline.find('alto:String', self.alto_ns)
+            string_elem = textline.find(self._string_tag)
             if string_elem is None:
                 continue
                 
@@ -653,40 +871,62 @@ class AltoToTeiConverter:
         
         return elements
     
+    def _iter_textblocks(self, alto_file: Path, info: Dict[str, Any]) -> Iterator[ET.Element]:
+        """Stream TextBlocks from an ALTO file, clearing each once the caller moves on
+        
+        The tags mapping and source image name are stored in ``info`` as they are
+        parsed; ALTO places both (Tags, Description) before the Layout section.
+        """
+        with self._tagrefs_memo(), open(alto_file, 'rb', buffering=IO_BUFFER_SIZE) as f:
+            for _, elem in ET.iterparse(f, events=('end',)):
+                tag = elem.tag
+                if tag == self._textblock_tag:
+                    yield elem
+                    elem.clear()
+                elif tag == self._tags_tag:
+                    info['tags_mapping'] = self.parse_tags_section(elem)
+                    # Resolutions made against the previous mapping no longer apply
+                    self._resolve_cache.clear()
+                elif tag == self._filename_tag and 'source_image' not in info:
+                    info['source_image'] = elem.text
+    
     def convert_alto_to_tei(self, alto_file: Path = None, alto_root: ET.Element = None) -> ET.Element:
         """Main conversion function"""
+        tei_root, _ = self.convert_and_collect(alto_file, alto_root)
+        return tei_root
+    
+    def convert_and_collect(self, alto_file: Path = None, 
+                            alto_root: ET.Element = None) -> Tuple[ET.Element, FileResult]:
+        """Convert ALTO to TEI and collect the extract_metadata_from_tree metadata in the same pass"""
+        with self._tagrefs_memo():
+            return self._convert_and_collect(alto_file, alto_root)
+    
+    def _convert_and_collect(self, alto_file: Optional[Path],
+                             alto_root: Optional[ET.Element]) -> Tuple[ET.Element, FileResult]:
+        """convert_and_collect body, run with a fresh TAGREFS memo"""
         if alto_root is None:
             if alto_file is None:
                 raise ValueError("Either alto_file or alto_root must be provided")
-            # Parse ALTO file
-            tree = ET.parse(alto_file)
-            alto_root = tree.getroot()
-        
-        # Parse tags
-        tags_mapping = self.parse_alto_tags(alto_root)
-        
-        # Create TEI root
-        tei_root = ET.Element('TEI')
-        tei_root.set('xmlns', self.tei_ns)
-        
-        # Add header
-        header = self.create_tei_header(alto_root)
-        tei_root.append(header)
-        
-        # Create text body
-        text_elem = ET.SubElement(tei_root, 'text')
-        body = ET.SubElement(text_elem, 'body')
+            # Stream the ALTO file block by block instead of building its whole tree
+            info = {'tags_mapping': {}}
+            textblocks = self._iter_textblocks(alto_file, info)
+        else:
+            info = {'tags_mapping': self.parse_alto_tags(alto_root)}
+            filename_elem = alto_root.find(self._filename_path)
+            if filename_elem is not None:
+                info['source_image'] = filename_elem.text
+            textblocks = alto_root.iter(self._textblock_tag)
         
-        # Find all text blocks
-        textblocks = alto_root.findall('.//alto:TextBlock', self.alto_ns)
+        metadata = FileResult()
         
         # Separate different types of content
         page_numbers = []
-        content_blocks = []
+        content_elements = []  # TEI elements converted from content blocks
         footnote_blocks = []
         block_elements = []  # For block-level TEI elements
         
         for textblock in textblocks:
+            tags_mapping = info['tags_mapping']
             block_type = self.get_block_type(textblock, tags_mapping)
             
             # Use rule engine to determine processing logic
@@ -694,47 +934,54 @@ class AltoToTeiConverter:
                 page_num = self.extract_page_number(textblock)
                 if page_num:
                     page_numbers.append(page_num)
+                    metadata.page_number = page_num
             elif self.rule_engine.should_extract_footnote(block_type):
                 footnote_content = self.extract_footnote_content(textblock)
                 if footnote_content:
                     footnote_blocks.append(footnote_content)
-            elif self.rule_engine.should_create_block_element(block_type):
-                # Create single TEI element from entire block
-                block_element = self.create_block_element(textblock, block_type)
-                if block_element is not None:
-                    block_elements.append(block_element)
-            elif not self.rule_engine.should_skip_block(block_type):
-                # Keep content blocks for processing
-                content_blocks.append(textblock)
+                    metadata.footnote_count += 1
+                    if footnote_content['symbol']:
+                        metadata.footnote_symbols.append(footnote_content['symbol'])
+            else:
+                if self.rule_engine.should_process_block(block_type):
+                    self._count_poetry_lines(textblock, tags_mapping, metadata)
+                
+                if self.rule_engine.should_create_block_element(block_type):
+                    # Create single TEI element from entire block
+                    block_element = self.create_block_element(textblock, block_type)
+                    if block_element is not None:
+                        block_elements.append(block_element)
+                elif not self.rule_engine.should_skip_block(block_type):
+                    # Convert content blocks right away so the ALTO block can be released
+                    content_elements.extend(self.convert_textblock(textblock, tags_mapping))
+        
+        # Create TEI root
+        tei_root = ET.Element('TEI')
+        tei_root.set('xmlns', self.tei_ns)
+        
+        # Add header
+        header = self._build_tei_header('source_image' in info, info.get('source_image'))
+        tei_root.append(header)
+        
+        # Create text body
+        text_elem = ET.SubElement(tei_root, 'text')
+        body = ET.SubElement(text_elem, 'body')
         
         # Add page break element if we found a page number
         if page_numbers:
             # Use the first page number found (usually there's only one per page)
-            filename_elem = alto_root.find('.//alto:sourceImageInformation/alto:fileName', self.alto_ns)
-            source_image = filename_elem.text if filename_elem is not None else None
             pb = self.rule_engine.create_element('page_number', 
                                                page_number=page_numbers[0], 
-                                               source_image=source_image)
+                                               source_image=info.get('source_image'))
             body.append(pb)
         
         # Add block elements (like running titles)
         for block_element in block_elements:
             body.append(block_element)
         
-        # Process content blocks
-        for textblock in content_blocks:
-            block_type = self.get_block_type(textblock, tags_mapping)
-            
-            # Skip blocks we don't want in content
-            if self.rule_engine.should_skip_block(block_type):
-                continue
-                
-            # Convert textblock to TEI elements
-            tei_elements = self.convert_textblock(textblock, tags_mapping)
-            
-            # Add elements to body
-            for elem in tei_elements:
-                body.append(elem)
+        # Add converted content blocks
+        for elem in content_elements:
+            body.append(elem)
         
         # Add footnotes at the end of the body
         if footnote_blocks:
@@ -748,20 +995,31 @@ class AltoToTeiConverter:
             
             body.append(footnote_div)
         
-        return tei_root
+        return tei_root, metadata
+    
+    def _count_poetry_lines(self, textblock: ET.Element, tags_mapping: Dict[str, str], 
+                            metadata: FileResult) -> None:
+        """Add the verse lines of a content block to the metadata counters"""
+        for textline in textblock.iter(self._textline_tag):
+            line_type = self.get_line_type(textline, tags_mapping)
+            if line_type == 'CustomLine:verse':
+                metadata.has_poetry = True
+                metadata.poetry_line_count += 1
     
     def extract_metadata_from_tree(self, alto_root: ET.Element) -> Dict[str, Any]:
-        """Extract metadata (page numbers, poetry, footnotes) from parsed ALTO tree"""
+        """Extract metadata (page numbers, poetry, footnotes) from parsed ALTO tree
+        
+        Metadata-only pass; callers that also need the TEI should use convert_and_collect.
+        """
+        with self._tagrefs_memo():
+            return self._extract_metadata_from_tree(alto_root)
+    
+    def _extract_metadata_from_tree(self, alto_root: ET.Element) -> Dict[str, Any]:
+        """extract_metadata_from_tree body, run with a fresh TAGREFS memo"""
         tags_mapping = self.parse_alto_tags(alto_root)
-        textblocks = alto_root.findall('.//alto:TextBlock', self.alto_ns)
-        
-        metadata = {
-            'page_number': None,
-            'has_poetry': False,
-            'poetry_line_count': 0,
-            'footnote_count': 0,
-            'footnote_symbols': []
-        }
+        textblocks = alto_root.iter(self._textblock_tag)
+        
+        metadata = FileResult()
         
         for textblock in textblocks:
             block_type = self.get_block_type(textblock, tags_mapping)
@@ -770,27 +1028,22 @@ class AltoToTeiConverter:
             if self.rule_engine.should_extract_page_number(block_type):
                 page_num = self.extract_page_number(textblock)
                 if page_num:
-                    metadata['page_number'] = page_num
+                    metadata.page_number = page_num
             
             elif self.rule_engine.should_extract_footnote(block_type):
                 footnote_content = self.extract_footnote_content(textblock)
                 if footnote_content:
-                    metadata['footnote_count'] += 1
+                    metadata.footnote_count += 1
                     if footnote_content['symbol']:
-                        metadata['footnote_symbols'].append(footnote_content['symbol'])
+                        metadata.footnote_symbols.append(footnote_content['symbol'])
             
             elif self.rule_engine.should_process_block(block_type):
                 # Check for poetry in this block
-                textlines = textblock.findall('.//alto:TextLine', self.alto_ns)
-                for textline in textlines:
-                    line_type = self.get_line_type(textline, tags_mapping)
-                    if line_type == 'CustomLine:verse':
-                        metadata['has_poetry'] = True
-                        metadata['poetry_line_count'] += 1
+                self._count_poetry_lines(textblock, tags_mapping, metadata)
         
-        return metadata
+        return metadata.to_dict()
     
-    def _setup_processing_paths(self, folder: str, output_folder: str = None) -> Tuple[Path, Path, List[str]]:
+    def _setup_processing_paths(self, folder: str, output_folder: str = None) -> Tuple[Path, Path, List[Path]]:
         """Setup and validate input/output paths, return file list"""
         folder_path = Path(folder)
         if not folder_path.exists():
@@ -803,49 +1056,46 @@ class AltoToTeiConverter:
         else:
             output_path = folder_path
         
-        xml_files = glob.glob(os.path.join(folder, "*.xml"))
+        xml_files = [Path(xml_file) for xml_file in glob.glob(os.path.join(folder, "*.xml"))]
         
         if not xml_files:
             raise ValueError(f"No XML files found in {folder}")
         
         return folder_path, output_path, xml_files
     
-    def _process_single_file(self, input_path: Path, output_path: Path, output_suffix: str) -> Dict[str, Any]:
-        """Process a single ALTO file and return metadata"""
+    def _process_single_file(self, input_path: Path, output_path: Path, output_suffix: str,
+                             in_memory: bool = False) -> FileResult:
+        """Process a single ALTO file and return metadata
+        
+        With in_memory, the TEI is returned as UTF-8 bytes in tei_bytes instead of being saved.
+        """
+        # Check if it's actually an ALTO file (reads only up to the root tag)
+        if not self.is_alto_file(input_path):
+            return FileResult(skipped=True, reason='Not an ALTO file')
+        
         try:
-            # Check if it's actually an ALTO file
-            if not self.is_alto_file(input_path):
-                return {'skipped': True, 'reason': 'Not an ALTO file'}
-            
-            # Parse file once and extract both metadata and convert to TEI
-            tree = ET.parse(input_path)
-            alto_root = tree.getroot()
+            # Stream the file once, converting to TEI and extracting metadata in one pass
+            tei_root, metadata = self.convert_and_collect(alto_file=input_path)
             
         except ET.ParseError as e:
-            return {'skipped': True, 'reason': f'XML parsing error: {e}'}
+            return FileResult(skipped=True, reason=f'XML parsing error: {e}')
         except (FileNotFoundError, PermissionError) as e:
-            return {'skipped': True, 'reason': f'File access error: {e}'}
-        
-        try:
-            # Extract metadata for reporting
-            metadata = self.extract_metadata_from_tree(alto_root)
-            
-            # Convert ALTO to TEI using already-parsed tree
-            tei_root = self.convert_alto_to_tei(alto_root=alto_root)
-            
+            return FileResult(skipped=True, reason=f'File access error: {e}')
         except Exception as e:
-            return {'skipped': True, 'reason': f'Conversion error: {e}'}
+            return FileResult(skipped=True, reason=f'Conversion error: {e}')
         
         try:
             # Create output filename and save
             output_file = output_path / f"{input_path.stem}{output_suffix}.xml"
-            self.save_tei(tei_root, output_file)
+            if in_memory:
+                metadata.tei_bytes = self.serialize_tei(tei_root)
+            else:
+                self.save_tei(tei_root, output_file)
             
         except (PermissionError, OSError) as e:
-            return {'skipped': True, 'reason': f'File writing error: {e}'}
+            return FileResult(skipped=True, reason=f'File writing error: {e}')
         
-        metadata['output_file'] = output_file.name
-        metadata['skipped'] = False
+        metadata.output_file = output_file.name
         return metadata
     
     def _print_processing_summary(self, successful: int, failed: int, skipped: int, page_numbers_found: List, 
@@ -857,62 +1107,134 @@ class AltoToTeiConverter:
         if skipped > 0:
             summary_parts.append(f"{skipped} skipped")
         
-        print(f"\n📊 Summary: {', '.join(summary_parts)}")
+        # Build the whole report first and print it in one write
+        lines = [f"\n📊 Summary: {', '.join(summary_parts)}"]
         
         if page_numbers_found:
-            print(f"📄 Page numbers found:")
-            for filename, page_num in page_numbers_found:
-                print(f"   {filename}: {page_num}")
+            lines.append("📄 Page numbers found:")
+            lines.extend(f"   {filename}: {page_num}" for filename, page_num in page_numbers_found)
         
         if poetry_files:
-            print(f"📝 Poetry detected:")
-            for filename, line_count in poetry_files:
-                print(f"   {filename}: {line_count} verse lines")
+            lines.append("📝 Poetry detected:")
+            lines.extend(f"   {filename}: {line_count} verse lines" for filename, line_count in poetry_files)
         
         if footnote_files:
-            print(f"📋 Footnotes detected:")
+            lines.append("📋 Footnotes detected:")
             for filename, count, symbols in footnote_files:
                 symbols_str = ', '.join(symbols) if symbols else 'no symbols detected'
-                print(f"   {filename}: {count} footnotes ({symbols_str})")
+                lines.append(f"   {filename}: {count} footnotes ({symbols_str})")
         
         if not any([page_numbers_found, poetry_files, footnote_files]):
-            print("📄 No page numbers, poetry, or footnotes detected in any files")
+            lines.append("📄 No page numbers, poetry, or footnotes detected in any files")
+        
+        print('\n'.join(lines))
     
     
     
     
     def save_tei(self, tei_root: ET.Element, output_file: Path) -> None:
         """Save TEI to file with proper formatting"""
-        # Create tree and apply standard indentation
-        tree = ET.ElementTree(tei_root)
-        ET.indent(tree, space="  ", level=0)  # Pretty print (Python 3.9+)
-        
-        # Convert to string for custom formatting
-        xml_str = ET.tostring(tei_root, encoding='unicode')
-        
-        # Apply custom line break formatting if line breaks are preserved
-        if self.rule_engine.should_preserve_line_breaks():
-            # Format lb elements to appear on separate lines
-            import re
-            # Replace <lb /> with newline + indented <lb />
-            xml_str = re.sub(r'([^>\n])<lb />', r'\1\n      <lb />', xml_str)
-            # If lb is followed by text, put text on next line
-            xml_str = re.sub(r'<lb />([^<\n])', r'<lb />\n      \1', xml_str)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with open(output_file, 'w', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
             f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-            f.write(xml_str)
+            self.write_tei(tei_root, f)
+    
+    def serialize_tei(self, tei_root: ET.Element) -> bytes:
+        """Serialize TEI exactly as save_tei writes it, as UTF-8 bytes"""
+        out = io.StringIO()
+        out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self.write_tei(tei_root, out)
+        return out.getvalue().encode('utf-8')
+    
+    def write_tei(self, tei_root: ET.Element, out: TextIO) -> None:
+        """Write an indented TEI tree to a text stream one subtree at a time"""
+        self._indent_tei(tei_root, self.rule_engine.should_preserve_line_breaks())
+        self._write_tei_element(tei_root, out, 0, True)
+    
+    def _write_tei_element(self, elem: ET.Element, out: TextIO, depth: int, only_child: bool) -> None:
+        """Serialize one TEI element, descending into the top levels instead of building one big string"""
+        if len(elem) and (depth < TEI_STREAM_DEPTH or only_child):
+            # Serialize a childless copy and split it around the closing tag
+            shell = ET.Element(elem.tag, elem.attrib)
+            shell.text = elem.text
+            shell.tail = elem.tail
+            xml_str = ET.tostring(shell, encoding='unicode', short_empty_elements=False)
+            split_at = xml_str.rindex('</')
+            out.write(xml_str[:split_at])
+            only_child = len(elem) == 1
+            for child in elem:
+                self._write_tei_element(child, out, depth + 1, only_child)
+            out.write(xml_str[split_at:])
+        else:
+            out.write(ET.tostring(elem, encoding='unicode'))
+    
+    def _indent_tei(self, tei_root: ET.Element, format_line_breaks: bool) -> None:
+        """Pretty-print the tree as ET.indent(space="  ") does, formatting line breaks in the same walk
+        
+        With format_line_breaks, bare <lb /> elements and any text following them go on their own lines.
+        """
+        indentations = ['\n']
+        
+        def indent_children(elem: ET.Element, level: int) -> None:
+            child_level = level + 1
+            if child_level < len(indentations):
+                child_indentation = indentations[child_level]
+            else:
+                child_indentation = indentations[level] + '  '
+                indentations.append(child_indentation)
+            
+            if not elem.text or not elem.text.strip():
+                elem.text = child_indentation
+            
+            previous = None
+            for child in elem:
+                if len(child):
+                    indent_children(child, child_level)
+                if not child.tail or not child.tail.strip():
+                    child.tail = child_indentation
+                
+                if format_line_breaks and child.tag == 'lb' and not child.attrib and not child.text and not len(child):
+                    # Break the line before the lb unless it already starts one or follows a tag
+                    if previous is None:
+                        if elem.text[-1] != '\n':
+                            elem.text += LB_INDENT
+                    elif previous.tail[-1] != '\n':
+                        previous.tail += LB_INDENT
+                    # Move text following the lb to the next line
+                    if child.tail[0] != '\n':
+                        child.tail = LB_INDENT + child.tail
+                previous = child
+            
+            # Dedent after the last child
+            if not child.tail.strip():
+                child.tail = indentations[level]
+        
+        if len(tei_root):
+            indent_children(tei_root, 0)
 
+    @staticmethod
+    def _is_alto_root(root: ET.Element) -> bool:
+        """Check whether an already parsed root element is an ALTO document"""
+        return 'alto' in root.tag
+    
     def is_alto_file(self, xml_file: Path) -> bool:
         """Check if XML file is in ALTO format"""
         try:
-            tree = ET.parse(xml_file)
-            root = tree.getroot()
-            return root.tag.endswith('alto') or 'alto' in root.tag
+            with open(xml_file, 'rb') as f:
+                # A root start tag without 'alto' in its name or namespace can be rejected unparsed
+                match = ROOT_START_TAG_PATTERN.match(f.read(ROOT_SNIFF_SIZE))
+                if match and b'alto' not in match.group() and b'&' not in match.group():
+                    return False
+                
+                # Otherwise parse up to the root start tag
+                f.seek(0)
+                for _, root in ET.iterparse(f, events=('start',)):
+                    return self._is_alto_root(root)
         except (ET.ParseError, FileNotFoundError, PermissionError) as e:
             return False
+        return False
 
-    def process_all_alto_files(self, folder: str, output_folder: str = None, output_suffix: str = "_tei") -> None:
+    def process_all_alto_files(self, folder: str, output_folder: str = None, output_suffix: str = "_tei",
+                               jobs: Optional[int] = None, aggregate_output: Optional[str] = None) -> None:
         """
         Process all ALTO XML files in the folder and convert them to TEI.
         
@@ -920,6 +1242,8 @@ class AltoToTeiConverter:
             folder: Folder containing .xml files.
             output_folder: Optional separate output folder (if None, saves in same folder)
             output_suffix: Suffix to add to output filenames (before .xml)
+            jobs: Number of worker processes (None uses all CPUs, 1 converts serially)
+            aggregate_output: Optional ZIP archive to store all TEI files in instead of separate files
         """
         try:
             # Setup paths and get file list
@@ -935,39 +1259,81 @@ class AltoToTeiConverter:
             poetry_files = []
             footnote_files = []
             
-            # Process each file
-            for i, xml_file in enumerate(xml_files, 1):
-                input_path = Path(xml_file)
-                print(f"[{i}/{len(xml_files)}] Processing: {input_path.name}")
-                
-                # Process single file
-                metadata = self._process_single_file(input_path, output_path, output_suffix)
-                
-                if metadata['skipped']:
-                    print(f"⚠️  Skipping {input_path.name}: {metadata['reason']}")
-                    skipped += 1
-                    continue
-                
-                # Store metadata for final reporting
-                if metadata['page_number']:
-                    page_numbers_found.append((input_path.name, metadata['page_number']))
-                if metadata['has_poetry']:
-                    poetry_files.append((input_path.name, metadata['poetry_line_count']))
-                if metadata['footnote_count'] > 0:
-                    footnote_files.append((input_path.name, metadata['footnote_count'], metadata['footnote_symbols']))
-                
-                # Create status message
-                status_parts = []
-                if metadata['page_number']:
-                    status_parts.append(f"Page: {metadata['page_number']}")
-                if metadata['has_poetry']:
-                    status_parts.append(f"Poetry: {metadata['poetry_line_count']} lines")
-                if metadata['footnote_count'] > 0:
-                    status_parts.append(f"Footnotes: {metadata['footnote_count']}")
+            total = len(xml_files)
+            in_memory = aggregate_output is not None
+            tasks = [(input_path, output_path, output_suffix, in_memory) for input_path in xml_files]
+            
+            # One archive for the whole batch saves an open/close per output file. It is opened
+            # before any work is queued, so a bad archive path fails before files get converted.
+            archive = zipfile.ZipFile(aggregate_output, 'w', compression=zipfile.ZIP_STORED) if in_memory else None
+            executor = None
+            
+            # Progress lines are batched so a fast run doesn't write to the terminal once per file
+            pending: List[str] = []
+            last_write = time.monotonic()
+            
+            def report(line: str) -> None:
+                nonlocal last_write
+                pending.append(line)
+                now = time.monotonic()
+                if now - last_write >= PROGRESS_FLUSH_INTERVAL:
+                    print('\n'.join(pending))
+                    pending.clear()
+                    last_write = now
+            
+            try:
+                # Small batches aren't worth the process start-up cost
+                if jobs == 1 or len(tasks) < PARALLEL_MIN_FILES:
+                    results = (self._process_single_file(*task) for task in tasks)
+                else:
+                    # Files are independent, so convert them in worker processes
+                    executor = ProcessPoolExecutor(max_workers=jobs or os.cpu_count(),
+                                                   initializer=_init_worker,
+                                                   initargs=(self.config_path, self.preserve_line_breaks))
+                    results = executor.map(_process_one, tasks, chunksize=8)
                 
-                status = f" ({', '.join(status_parts)})" if status_parts else ""
-                print(f"✅ Converted: {input_path.name} -> {metadata['output_file']}{status}")
-                successful += 1
+                # Report each file in input order
+                for i, (input_path, metadata) in enumerate(zip(xml_files, results), 1):
+                    name = input_path.name
+                    report(f"[{i}/{total}] Processing: {name}")
+                    
+                    if metadata.skipped:
+                        report(f"⚠️  Skipping {name}: {metadata.reason}")
+                        skipped += 1
+                        continue
+                    
+                    if archive is not None:
+                        archive.writestr(metadata.output_file, metadata.tei_bytes)
+                        metadata.tei_bytes = None
+                    
+                    # Store metadata for final reporting
+                    if metadata.page_number:
+                        page_numbers_found.append((name, metadata.page_number))
+                    if metadata.has_poetry:
+                        poetry_files.append((name, metadata.poetry_line_count))
+                    if metadata.footnote_count > 0:
+                        footnote_files.append((name, metadata.footnote_count, metadata.footnote_symbols))
+                    
+                    # Create status message
+                    status_parts = []
+                    if metadata.page_number:
+                        status_parts.append(f"Page: {metadata.page_number}")
+                    if metadata.has_poetry:
+                        status_parts.append(f"Poetry: {metadata.poetry_line_count} lines")
+                    if metadata.footnote_count > 0:
+                        status_parts.append(f"Footnotes: {metadata.footnote_count}")
+                    
+                    status = f" ({', '.join(status_parts)})" if status_parts else ""
+                    report(f"✅ Converted: {name} -> {metadata.output_file}{status}")
+                    successful += 1
+            finally:
+                if pending:
+                    print('\n'.join(pending))
+                if executor is not None:
+                    # Don't keep converting queued files if the loop stopped early
+                    executor.shutdown(cancel_futures=True)
+                if archive is not None:
+                    archive.close()
             
             # Print final summary
             self._print_processing_summary(successful, failed, skipped, page_numbers_found, poetry_files, footnote_files)
@@ -977,6 +1343,22 @@ class AltoToTeiConverter:
             return
 
 
+# Below this many files process_all_alto_files converts serially
+PARALLEL_MIN_FILES = 4
+
+# Per-process converter used by process_all_alto_files workers
+_worker_converter: Optional[AltoToTeiConverter] = None
+
+def _init_worker(config_path: str, preserve_line_breaks: Optional[bool]) -> None:
+    """Build the converter once per worker process"""
+    global _worker_converter
+    _worker_converter = AltoToTeiConverter(config_path, preserve_line_breaks=preserve_line_breaks)
+
+def _process_one(task: Tuple[Path, Path, str, bool]) -> FileResult:
+    """Convert one (input_path, output_path, output_suffix, in_memory) task in a worker; return its metadata"""
+    return _worker_converter._process_single_file(*task)
+
+
 def main() -> None:
     """Main function with command-line argument parsing"""
     parser = argparse.ArgumentParser(
@@ -1040,6 +1422,19 @@ Examples:
         help="Disable line break preservation, join lines with spaces"
     )
     
+    parser.add_argument(
+        "--aggregate-output",
+        metavar="ZIP_FILE",
+        help="Store all TEI files in one ZIP archive instead of separate files in the output folder"
+    )
+    
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)"
+    )
+    
     args = parser.parse_args()
     
     # Use flag arguments if provided, otherwise use positional arguments
@@ -1058,7 +1453,8 @@ Examples:
         print(f"Line break preservation: {'enabled' if preserve_line_breaks else 'disabled'}")
     
     converter = AltoToTeiConverter(config_path=args.config, preserve_line_breaks=preserve_line_breaks)
-    converter.process_all_alto_files(input_folder, output_folder, args.suffix)
+    converter.process_all_alto_files(input_folder, output_folder, args.suffix, jobs=args.jobs,
+                                     aggregate_output=args.aggregate_output)
 
 if __name__ == "__main__":
     main()
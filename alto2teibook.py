@@ -9,12 +9,16 @@ It extends the functionality of alto2tei.py for book-level processing.
 
 import xml.etree.ElementTree as ET
 import argparse
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from alto2tei import AltoToTeiConverter
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from alto2tei import AltoToTeiConverter, IO_BUFFER_SIZE
 
 # Import facsimile module
-from facsimile import FacsimileExtractor, FacsimileTEIGenerator
+from facsimile import FacsimileExtractor, FacsimileTEIGenerator, PageFacsimile
 
 
 # Constants
@@ -58,6 +62,13 @@ class MetsParser:
         self.mets_path = mets_path
         self.mets_ns = {'mets': 'http://www.loc.gov/METS/',
                        'xlink': 'http://www.w3.org/1999/xlink'}
+        
+        # Prebuilt Clark-notation paths, so find() skips prefix expansion
+        mets_uri = self.mets_ns['mets']
+        self._file_grp_tag = f'{{{mets_uri}}}fileGrp'
+        self._file_tag = f'{{{mets_uri}}}file'
+        self._flocat_tag = f'{{{mets_uri}}}FLocat'
+        
         self._pages = None
         self._metadata = None
 
@@ -83,20 +94,28 @@ class MetsParser:
     def _parse_mets(self) -> None:
         """Parse METS.xml and extract page order and metadata"""
         try:
-            tree = ET.parse(self.mets_path)
-            root = tree.getroot()
-
-            # Extract page order from fileSec
+            # Extract page order from the first export fileGrp, streaming the rest of the file
             pages = []
-            file_grp = root.find(f'.//mets:fileGrp[@USE="{METS_USE_EXPORT}"]', self.mets_ns)
-            if file_grp is not None:
-                for file_elem in file_grp.findall('mets:file', self.mets_ns):
-                    flocat = file_elem.find('mets:FLocat', self.mets_ns)
-                    if flocat is not None:
-                        # Try both the namespaced and non-namespaced attribute
-                        href = flocat.get(XLINK_HREF_ATTRIBUTE) or flocat.get('href')
-                        if href and href.endswith('.xml'):
-                               pages.append(href)
+            file_grp = None
+            in_file_grp = False
+            for event, elem in ET.iterparse(self.mets_path, events=('start', 'end')):
+                if event == 'start':
+                    if file_grp is None and elem.tag == self._file_grp_tag and elem.get('USE') == METS_USE_EXPORT:
+                        file_grp = elem
+                        in_file_grp = True
+                elif elem is file_grp:
+                    in_file_grp = False
+                    for file_elem in file_grp.iterfind(self._file_tag):
+                        flocat = file_elem.find(self._flocat_tag)
+                        if flocat is not None:
+                            # Try both the namespaced and non-namespaced attribute
+                            href = flocat.get(XLINK_HREF_ATTRIBUTE) or flocat.get('href')
+                            if href and href.endswith('.xml'):
+                                   pages.append(href)
+                    file_grp.clear()
+                elif not in_file_grp:
+                    # Only the export group has to stay in memory
+                    elem.clear()
 
             self._pages = pages
 
@@ -131,9 +150,12 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
         enable_facsimile: Whether to extract spatial coordinates
         pages_data: List of processed page data
         page_facsimiles: List of extracted facsimile data (if enabled)
+        jobs: Number of worker processes for per-page work (None uses all CPUs, 1 works serially)
+        verbose: Whether to print a progress line for every page
     """
 
-    def __init__(self, mets_path: Path, merge_lines: bool = True, enable_facsimile: bool = True):
+    def __init__(self, mets_path: Path, merge_lines: bool = True, enable_facsimile: bool = True,
+                 jobs: Optional[int] = None, verbose: bool = True):
         # Use the line type configuration for the parent class (AltoToTeiConverter)
         super().__init__("config/alto_tei_mapping.yaml")
         self.mets_path = mets_path
@@ -141,6 +163,12 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
         self.pages_data = []
         self.merge_lines = merge_lines
         self.enable_facsimile = enable_facsimile
+        self.jobs = jobs
+        self.verbose = verbose
+
+        # Prebuilt Clark-notation path for namespaced page bodies
+        self._tei_body_path = f'.//{{{self.tei_ns}}}body'
+        self.refresh_rule_cache()
 
         # Note: book configuration is now handled through the rule engine's YAML config
 
@@ -151,6 +179,12 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
             self.page_facsimiles = []
             self.zone_mapping = {}  # Maps ALTO element IDs to facsimile zone IDs
 
+    def refresh_rule_cache(self) -> None:
+        """Re-read rule engine settings cached on the converter (call after changing them at runtime)"""
+        # Book settings used for every page
+        self._file_formats = self.rule_engine.get_file_formats_config()
+        self._book_structure = self.rule_engine.get_book_structure_config()
+
     def convert_book_to_tei(self, output_file: Path) -> None:
         """Convert entire book to TEI format"""
         try:
@@ -182,34 +216,93 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
     def _process_all_pages_in_order(self) -> None:
         """Process each page according to METS order"""
         page_files = self.mets_parser.get_page_order()
+        total = len(page_files)
         mets_dir = self.mets_path.parent
         
-        for i, page_file in enumerate(page_files, 1):
-            self._process_single_page(page_file, i, mets_dir)
-
-    def _process_single_page(self, page_file: str, page_number: int, mets_dir: Path) -> None:
-        """Process a single page file"""
-        page_path = mets_dir / page_file
-        if not page_path.exists():
-            print(f"⚠️  Warning: Page file not found: {page_path}")
+        # Check every page first so the conversions can be handed out together
+        page_paths = [mets_dir / page_file for page_file in page_files]
+        found = self._find_existing_pages(page_paths)
+        tasks = [(page_path, i) for i, (page_path, exists) in enumerate(zip(page_paths, found), 1) if exists]
+        
+        page_teis = self._map_pages('_convert_page', tasks)
+        try:
+            for i, (page_file, page_path, exists) in enumerate(zip(page_files, page_paths, found), 1):
+                if not exists:
+                    print(f"⚠️  Warning: Page file not found: {page_path}")
+                    continue
+                
+                if self.verbose:
+                    print(f"Processing page {i}/{total}: {page_file}")
+                
+                try:
+                    page_tei = next(page_teis)
+                except Exception as e:
+                    raise PageProcessingError(f"Failed to process {page_file}: {e}") from e
+                
+                self.pages_data.append({
+                    'filename': page_file,
+                    'page_number': i,
+                    'tei_content': page_tei
+                })
+        finally:
+            page_teis.close()
+
+    @staticmethod
+    def _find_existing_pages(page_paths: List[Path]) -> List[bool]:
+        """Check which page files exist, listing each folder once instead of a stat call per page"""
+        listings: Dict[Path, set] = {}
+        found = []
+        for page_path in page_paths:
+            folder = page_path.parent
+            names = listings.get(folder)
+            if names is None:
+                try:
+                    with os.scandir(folder) as entries:
+                        # Path.exists() follows symlinks, so leave out dangling ones
+                        names = {entry.name for entry in entries
+                                 if not entry.is_symlink() or os.path.exists(entry.path)}
+                except OSError:
+                    names = set()
+                listings[folder] = names
+            # Names in the listing match case-sensitively; defer to Path.exists() for the rest, as
+            # a differently cased METS href still finds the file on case-insensitive file systems
+            found.append(page_path.name in names or page_path.exists())
+        return found
+
+    def _convert_page(self, page_path: Path, page_number: int) -> ET.Element:
+        """Convert a single page file to TEI"""
+        # Use merged content if line merging is enabled
+        if self.merge_lines:
+            return self._convert_page_with_merged_lines(page_path, page_number)
+        return self.convert_alto_to_tei(page_path)
+
+    def _map_pages(self, method_name: str, tasks: List[Tuple[Path, int]]) -> Iterator[Any]:
+        """Yield method_name(page_path, page_number) for each task in order
+        
+        Larger books are spread over worker processes, each with its own converter.
+        """
+        workers = self.jobs or os.cpu_count() or 1
+        if workers == 1 or len(tasks) < PARALLEL_MIN_PAGES:
+            method = getattr(self, method_name)
+            # Keep the OS reading PREFETCH_PAGES pages ahead while each page is converted
+            for page_path, _ in tasks[:PREFETCH_PAGES]:
+                _prefetch_file(page_path)
+            for i, task in enumerate(tasks):
+                if i + PREFETCH_PAGES < len(tasks):
+                    _prefetch_file(tasks[i + PREFETCH_PAGES][0])
+                yield method(*task)
             return
-            
-        print(f"Processing page {page_number}/{len(self.mets_parser.get_page_order())}: {page_file}")
         
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_book_worker,
+                                       initargs=(self.mets_path, self.merge_lines, self.enable_facsimile))
         try:
-            # Use merged content if line merging is enabled
-            if self.merge_lines:
-                page_tei = self._convert_page_with_merged_lines(page_path, page_number)
-            else:
-                page_tei = self.convert_alto_to_tei(page_path)
-            
-            self.pages_data.append({
-                'filename': page_file,
-                'page_number': page_number,
-                'tei_content': page_tei
-            })
-        except Exception as e:
-            raise PageProcessingError(f"Failed to process {page_file}: {e}") from e
+            for result, error in executor.map(_run_page_task, repeat(method_name), tasks, chunksize=4):
+                # Re-raise a page's error at that page, not at the start of its chunk
+                if error is not None:
+                    raise error
+                yield result
+        finally:
+            executor.shutdown(cancel_futures=True)
 
     def _create_and_clean_book_tei(self, book_metadata: Dict[str, Any]) -> ET.Element:
         """Create complete book TEI and clean attributes"""
@@ -237,17 +330,16 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
         if element is None:
             return
 
-        # Clean attributes of current element
-        if element.attrib:
-            # Find keys with None values
-            none_keys = [key for key, value in element.attrib.items() if value is None]
-            # Remove None attributes
-            for key in none_keys:
-                del element.attrib[key]
-
-        # Recursively clean children
-        for child in element:
-            self._clean_none_attributes(child)
+        # Walk the whole subtree in one iter() instead of recursing per child
+        for elem in element.iter():
+            attrib = elem.attrib
+            # Most elements have no None values; the values() containment test rules them out in C
+            if attrib and None in attrib.values():
+                # Find keys with None values
+                none_keys = [key for key, value in attrib.items() if value is None]
+                # Remove None attributes
+                for key in none_keys:
+                    del attrib[key]
 
     def _extract_all_facsimiles(self) -> None:
         """Extract facsimile data from all ALTO files
@@ -265,23 +357,37 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
         page_files = self.mets_parser.get_page_order()
         mets_dir = self.mets_path.parent
 
-        for i, page_file in enumerate(page_files, 1):
-            page_path = mets_dir / page_file
-            if page_path.exists():
-                try:
-                    page_facs = self.facsimile_extractor.extract_page_facsimile(page_path, i)
-                    self.page_facsimiles.append(page_facs)
+        page_paths = [mets_dir / page_file for page_file in page_files]
+        found_files = []
+        tasks = []
+        for i, (page_file, page_path, exists) in enumerate(
+                zip(page_files, page_paths, self._find_existing_pages(page_paths)), 1):
+            if exists:
+                found_files.append(page_file)
+                tasks.append((page_path, i))
+
+        # Extract pages (possibly in parallel), then merge the zone mapping in page order
+        for page_file, (page_facs, error) in zip(found_files, self._map_pages('_extract_page_facsimile', tasks)):
+            if error is not None:
+                print(f"⚠️  Warning: Could not extract facsimile from {page_file}: {error}")
+                continue
 
-                    # Build zone mapping for linking
-                    for zone in page_facs.zones:
-                        if zone.element_id:
-                            self.zone_mapping[zone.element_id] = zone.id
+            self.page_facsimiles.append(page_facs)
 
-                except Exception as e:
-                    print(f"⚠️  Warning: Could not extract facsimile from {page_file}: {e}")
+            # Build zone mapping for linking
+            for zone in page_facs.zones:
+                if zone.element_id:
+                    self.zone_mapping[zone.element_id] = zone.id
 
         print(f"📐 Extracted facsimile data for {len(self.page_facsimiles)} pages with {len(self.zone_mapping)} zones")
 
+    def _extract_page_facsimile(self, page_path: Path, page_number: int) -> Tuple[Optional[PageFacsimile], Optional[str]]:
+        """Extract one page's facsimile zones; return (page_facsimile, None) or (None, error message)"""
+        try:
+            return self.facsimile_extractor.extract_page_facsimile(page_path, page_number), None
+        except Exception as e:
+            return None, str(e)
+
     def _get_facsimile_config(self) -> Dict[str, Any]:
         """Get facsimile configuration from YAML rule engine"""
         return self.rule_engine.get_book_facsimile_config()
@@ -309,7 +415,7 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
         body_elem = ET.SubElement(text_elem, 'body')
 
         # Create book div if configured
-        book_structure = self.rule_engine.get_book_structure_config()
+        book_structure = self._book_structure
         if book_structure.get('create_book_div', True):
             book_div = ET.SubElement(body_elem, 'div')
             book_div.set('type', book_structure.get('div_type', 'book'))
@@ -345,7 +451,7 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
         title_elem = ET.SubElement(title_stmt, 'title')
 
         # Use configured title template or fallback
-        book_structure = self.rule_engine.get_book_structure_config()
+        book_structure = self._book_structure
         title_template = book_structure.get('header_title_template', 'Book converted from ALTO (pages 1-{total_pages})')
         total_pages = metadata.get('total_pages', 'unknown')
         title_elem.text = title_template.format(total_pages=total_pages, first_page=1, last_page=total_pages)
@@ -381,7 +487,7 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
                 facs_ref = f'#{surface_id}'
         else:
             # Fallback to filename-based reference using configured extensions
-            file_formats = self.rule_engine.get_file_formats_config()
+            file_formats = self._file_formats
             alto_ext = file_formats.get('alto_extension', '.xml')
             image_ext = file_formats.get('default_image_extension', '.jpeg')
             facs_ref = f"{filename.replace(alto_ext, '')}{image_ext}"
@@ -407,16 +513,11 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
         body = self._find_body_element(page_tei)
 
         if body is not None:
-            # Copy all content from page body to book (except existing pb elements)
-            for child in body:
-                # Skip page break elements that are already in individual pages
-                # as we add our own page breaks
-                if self.rule_engine.should_skip_element(child.tag, self.tei_ns):
-                    continue
-
-                # Create a copy of the element to avoid moving from original tree
-                copied_elem = self._copy_element_deep(child)
-                book_div.append(copied_elem)
+            # Copy all content from page body to book (except existing pb elements),
+            # skipping page breaks that are already in individual pages as we add our own.
+            # Copies avoid moving elements from the original tree; extend adds them in one call.
+            book_div.extend([self._copy_element_deep(child) for child in body
+                             if not self.rule_engine.should_skip_element(child.tag, self.tei_ns)])
         else:
             # If no body found, add a comment indicating empty page
             comment = ET.Comment(f" Page {page_data['page_number']} ({page_data['filename']}): No content found ")
@@ -424,18 +525,13 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
 
     def _find_body_element(self, page_tei: ET.Element) -> Optional[ET.Element]:
         """Find body element in TEI using multiple fallback approaches"""
-        # First try with namespace
-        tei_ns_dict = {'tei': self.tei_ns}
-        body = page_tei.find('.//tei:body', tei_ns_dict)
+        # First try with namespace (the tei: prefix and the Clark tag are the same query)
+        body = page_tei.find(self._tei_body_path)
 
         # If not found, try without namespace (fallback)
         if body is None:
             body = page_tei.find('.//body')
 
-        # If still not found, try with full namespace in tag
-        if body is None:
-            body = page_tei.find(f'.//{{{self.tei_ns}}}body')
-
         return body
 
     def _copy_element_deep(self, elem: ET.Element) -> ET.Element:
@@ -443,16 +539,8 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
         if elem is None:
             return None
 
-        new_elem = ET.Element(elem.tag, elem.attrib)
-        new_elem.text = elem.text
-        new_elem.tail = elem.tail
-
-        for child in elem:
-            copied_child = self._copy_element_deep(child)
-            if copied_child is not None:
-                new_elem.append(copied_child)
-
-        return new_elem
+        # Element.__deepcopy__ copies the subtree in C
+        return copy.deepcopy(elem)
 
     def _add_pages_with_cross_page_merging(self, book_div: ET.Element) -> None:
         """Add all pages with cross-page paragraph merging"""
@@ -471,16 +559,11 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
             body = self._find_body_element(page_tei)
 
             if body is not None:
-                # Copy all content from page body to book (except existing pb elements)
-                for child in body:
-                    # Skip page break elements that are already in individual pages
-                    # as we add our own page breaks
-                    if child.tag == 'pb' or child.tag.endswith('}pb'):
-                        continue
-
-                    # Create a copy of the element to avoid moving from original tree
-                    copied_elem = self._copy_element_deep(child)
-                    book_div.append(copied_elem)
+                # Copy all content from page body to book (except existing pb elements),
+                # skipping page breaks that are already in individual pages as we add our own.
+                # Copies avoid moving elements from the original tree; extend adds them in one call.
+                book_div.extend([self._copy_element_deep(child) for child in body
+                                 if not (child.tag == 'pb' or child.tag.endswith('}pb'))])
             else:
                 # If no body found, add a comment indicating empty page
                 comment = ET.Comment(f" Page {page_data['page_number']} ({page_data['filename']}): No content found ")
@@ -500,16 +583,10 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
         body = self._find_body_element(page_tei)
 
         if body is not None:
-            # Copy all content from page body to book with facsimile enhancement
-            for child in body:
-                # Skip page break elements that are already in individual pages
-                # as we add our own page breaks
-                if self.rule_engine.should_skip_element(child.tag, self.tei_ns):
-                    continue
-
-                # Create a copy of the element and enhance with facsimile links
-                copied_elem = self._copy_element_with_facsimile_links(child)
-                book_div.append(copied_elem)
+            # Copy all content from page body to book with facsimile enhancement,
+            # skipping page breaks that are already in individual pages as we add our own
+            book_div.extend([self._copy_element_with_facsimile_links(child) for child in body
+                             if not self.rule_engine.should_skip_element(child.tag, self.tei_ns)])
         else:
             # If no body found, add a comment indicating empty page
             comment = ET.Comment(f" Page {page_data['page_number']} ({page_data['filename']}): No content found ")
@@ -532,16 +609,10 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
             body = self._find_body_element(page_tei)
 
             if body is not None:
-                # Copy all content from page body to book with facsimile enhancement
-                for child in body:
-                    # Skip page break elements that are already in individual pages
-                    # as we add our own page breaks
-                    if child.tag == 'pb' or child.tag.endswith('}pb'):
-                        continue
-
-                    # Create a copy of the element and enhance with facsimile links
-                    copied_elem = self._copy_element_with_facsimile_links(child)
-                    book_div.append(copied_elem)
+                # Copy all content from page body to book with facsimile enhancement,
+                # skipping page breaks that are already in individual pages as we add our own
+                book_div.extend([self._copy_element_with_facsimile_links(child) for child in body
+                                 if not (child.tag == 'pb' or child.tag.endswith('}pb'))])
             else:
                 # If no body found, add a comment indicating empty page
                 comment = ET.Comment(f" Page {page_data['page_number']} ({page_data['filename']}): No content found ")
@@ -549,38 +620,19 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
 
     def _copy_element_with_facsimile_links(self, elem: ET.Element) -> ET.Element:
         """Copy element and add facsimile references where possible"""
-        if not self.enable_facsimile:
-            return self._copy_element_deep(elem)
-
-        new_elem = ET.Element(elem.tag, elem.attrib)
-        new_elem.text = elem.text
-        new_elem.tail = elem.tail
-
-        # Try to add facsimile reference based on element type
-        self._add_facsimile_reference(new_elem, elem)
-
-        # Recursively copy children with facsimile enhancement
-        for child in elem:
-            copied_child = self._copy_element_with_facsimile_links(child)
-            if copied_child is not None:
-                new_elem.append(copied_child)
-
-        return new_elem
-
-    def _add_facsimile_reference(self, tei_elem: ET.Element, original_elem: ET.Element) -> None:
-        """Add facsimile reference to TEI element if possible"""
+        new_elem = self._copy_element_deep(elem)
         if not self.enable_facsimile or not self.zone_mapping:
-            return
+            return new_elem
 
-        # Try to find facsimile reference based on ALTO element ID
-        alto_id = original_elem.get('ID')
-        if alto_id and alto_id in self.zone_mapping:
-            zone_id = self.zone_mapping[alto_id]
-            tei_elem.set('facs', f'#{zone_id}')
-            return
+        # Link copied elements to facsimile zones by their ALTO element ID in one pass
+        # (get() doesn't materialize an attrib dict on elements without attributes)
+        zone_mapping = self.zone_mapping
+        for copied in new_elem.iter():
+            zone_id = zone_mapping.get(copied.get('ID'))
+            if zone_id is not None:
+                copied.set('facs', f'#{zone_id}')
 
-        # Note: getparent() is not available in standard ElementTree
-        # Fallback facsimile linking would require additional element tracking
+        return new_elem
 
     def _add_pages_with_cross_page_paragraph_merging(self, book_div: ET.Element) -> None:
         """Add all pages with proper cross-page paragraph merging for clean text output"""
@@ -614,8 +666,7 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
                 paragraph_state = page_elements['paragraph_state']
                 
             # Add all elements except the current paragraph (we'll add it when complete)
-            for elem in page_elements['completed_elements']:
-                book_div.append(elem)
+            book_div.extend(page_elements['completed_elements'])
                 
         # Add any remaining open paragraph at the end
         if current_paragraph is not None:
@@ -628,34 +679,32 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
                                         page_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """Extract content from a page with proper paragraph continuation handling"""
         
-        # Parse ALTO file
-        tree = ET.parse(alto_file)
-        alto_root = tree.getroot()
-        tags_mapping = self.parse_alto_tags(alto_root)
-        
-        # Find all text blocks
-        textblocks = alto_root.findall('.//alto:TextBlock', self.alto_ns)
+        # Stream the ALTO file block by block instead of building its whole tree
+        info = {'tags_mapping': {}}
+        textblocks = self._iter_textblocks(alto_file, info)
         
         completed_elements = []
         page_break_inserted = False
         
         # Process each text block
         for textblock in textblocks:
+            tags_mapping = info['tags_mapping']
             block_type = self.get_block_type(textblock, tags_mapping)
             
             # In merge-lines mode, skip certain block types entirely
             if self._should_skip_block_in_merge_mode(block_type):
                 continue
                 
-            # Process lines in this block
-            textlines = textblock.findall('.//alto:TextLine', self.alto_ns)
+            # Process lines in this block, counting the non-empty ones for facsimile IDs
+            line_count = 0
             
-            for textline in textlines:
+            for textline in textblock.iter(self._textline_tag):
                 line_type = self.get_line_type(textline, tags_mapping)
                 line_text = self.extract_text_from_line(textline).strip()
                 
                 if not line_text:  # Skip empty lines
                     continue
+                line_count += 1
                 
                 # Insert page break before the first content line of this page (except first page)
                 if add_page_break and not page_break_inserted:
@@ -682,7 +731,7 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
                 line_facs_id = None
                 if self.enable_facsimile:
                     # Use a simple line counter for facsimile IDs in merge mode
-                    line_facs_id = f"facs_line_{page_number}_{len(completed_elements) + 1}_{len([l for l in textlines[:textlines.index(textline)+1] if self.extract_text_from_line(l).strip()])}"
+                    line_facs_id = f"facs_line_{page_number}_{len(completed_elements) + 1}_{line_count}"
 
                 # Handle different line types for paragraph boundaries
                 if line_type == 'CustomLine:paragraph_start':
@@ -817,49 +866,32 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
 
     def extract_text_from_line(self, textline: ET.Element) -> str:
         """Extract text content from an ALTO TextLine element"""
-        strings = textline.findall('alto:String', self.alto_ns)
-        if not strings:
-            return ""
-        
-        # Combine all string contents from the line
-        text_parts = [
-            string.get('CONTENT', '') 
-            for string in strings 
-            if string.get('CONTENT', '').strip()
-        ]
+        # Combine all non-blank string contents from the line, reading CONTENT once per String
+        text_parts = []
+        append = text_parts.append
+        for string in textline.iterfind(self._string_tag):
+            content = string.get('CONTENT')
+            if content and not content.isspace():
+                append(content)
         
         return ' '.join(text_parts).strip()
 
     def _convert_page_with_merged_lines(self, alto_file: Path, page_number: int) -> ET.Element:
         """Convert a single ALTO page to TEI with line merging enabled"""
 
-        # Parse ALTO file using existing logic
-        tree = ET.parse(alto_file)
-        alto_root = tree.getroot()
-        tags_mapping = self.parse_alto_tags(alto_root)
-
-        # Create TEI root
-        tei_root = ET.Element('TEI')
-        tei_root.set('xmlns', self.tei_ns)
-
-        # Add header
-        header = self.create_tei_header(alto_root)
-        tei_root.append(header)
-
-        # Create text body
-        text_elem = ET.SubElement(tei_root, 'text')
-        body = ET.SubElement(text_elem, 'body')
-
-        # Find all text blocks
-        textblocks = alto_root.findall('.//alto:TextBlock', self.alto_ns)
+        # Stream the ALTO file block by block; the tags mapping and source image precede the blocks
+        info = {'tags_mapping': {}}
+        textblocks = self._iter_textblocks(alto_file, info)
 
         # Separate different types of content
         page_numbers = []
-        content_blocks = []
+        content_elements = []  # TEI elements converted from content blocks
         footnote_blocks = []
         block_elements = []  # For block-level TEI elements
+        block_index = 0  # Position among content blocks, for facsimile IDs
 
-        for _, textblock in enumerate(textblocks):
+        for textblock in textblocks:
+            tags_mapping = info['tags_mapping']
             block_type = self.get_block_type(textblock, tags_mapping)
 
             # Let the rule engine handle all line types automatically, including signatures
@@ -886,42 +918,44 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
                 if block_element is not None:
                     block_elements.append(block_element)
             elif not self.rule_engine.should_skip_block(block_type):
-                # Keep content blocks for processing
-                content_blocks.append(textblock)
+                # Convert content blocks right away so the ALTO block can be released
+                block_index += 1
+                content_elements.extend(self.convert_textblock_with_facsimile(
+                    textblock, tags_mapping, page_number, block_index))
             else:
                 # Check for special lines in blocks that don't normally process content
                 special_elements = self._extract_special_lines_from_block(textblock, tags_mapping, block_type)
                 if special_elements:
                     block_elements.extend(special_elements)
 
+        # Look up the source image once for both the header and the page break
+        source_image = info.get('source_image')
+
+        # Create TEI root
+        tei_root = ET.Element('TEI')
+        tei_root.set('xmlns', self.tei_ns)
+
+        # Add header
+        header = self._build_tei_header('source_image' in info, source_image)
+        tei_root.append(header)
+
+        # Create text body
+        text_elem = ET.SubElement(tei_root, 'text')
+        body = ET.SubElement(text_elem, 'body')
+
         # Add page break element if we found a page number
         if page_numbers:
             # Use the first page number found (usually there's only one per page)
-            filename_elem = alto_root.find('.//alto:sourceImageInformation/alto:fileName', self.alto_ns)
-            source_image = filename_elem.text if filename_elem is not None else None
             pb = self.rule_engine.create_element('page_number',
                                page_number=page_numbers[0],
                                source_image=source_image)
             body.append(pb)
 
         # Add block elements (like running titles)
-        for block_element in block_elements:
-            body.append(block_element)
-
-        # Process content blocks with line merging
-        for block_index, textblock in enumerate(content_blocks, 1):
-            block_type = self.get_block_type(textblock, tags_mapping)
-
-            # Skip blocks we don't want in content
-            if self.rule_engine.should_skip_block(block_type):
-                continue
-
-            # Convert textblock to TEI elements using rule engine with facsimile support
-            tei_elements = self.convert_textblock_with_facsimile(textblock, tags_mapping, page_number, block_index)
+        body.extend(block_elements)
 
-            # Add elements to body
-            for elem in tei_elements:
-                body.append(elem)
+        # Add content blocks converted with line merging
+        body.extend(content_elements)
 
         # Add footnotes at the end of the body
         if footnote_blocks:
@@ -950,10 +984,6 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
     def _convert_textblock_with_seg_facsimile(self, textblock: ET.Element, tags_mapping: Dict[str, str], 
                                             page_number: int, block_index: int) -> List[ET.Element]:
         """Convert TextBlock to TEI with seg elements and facsimile linking"""
-        textlines = textblock.findall('.//alto:TextLine', self.alto_ns)
-        if not textlines:
-            return []
-        
         elements = []
         state = {'current_p': None, 'current_lg': None}
         line_index = 1
@@ -961,9 +991,9 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
         # Generate block facsimile ID for paragraphs
         block_facs_id = self.rule_engine.generate_facsimile_id('block', page_number, block_index=block_index)
         
-        for textline in textlines:
-            line_type = self.get_line_type(textline, tags_mapping)
-            string_elem = textline.find('alto:String', self.alto_ns)
+        # Walk the TextLines once, reading each line's String before resolving its type
+        for textline in textblock.iter(self._textline_tag):
+            string_elem = textline.find(self._string_tag)
             
             if string_elem is None:
                 continue
@@ -972,6 +1002,8 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
             if not text_content:
                 continue
             
+            line_type = self.get_line_type(textline, tags_mapping)
+            
             # Generate line facsimile ID
             line_facs_id = self.rule_engine.generate_facsimile_id('line', page_number, 
                                                                block_index=block_index, 
@@ -1033,7 +1065,7 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
         special_elements = []
         
         # Get all textlines in this block
-        textlines = textblock.findall('.//alto:TextLine', self.alto_ns)
+        textlines = textblock.iter(self._textline_tag)
         
         for textline in textlines:
             # Get line type
@@ -1042,7 +1074,7 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
             # Check if this line type should be processed as special content
             if self.rule_engine.should_process_special_line(block_type, line_type):
                 # Get the text content
-                string_elem = textline.find('alto:String', self.alto_ns)
+                string_elem = textline.find(self._string_tag)
                 if string_elem is not None:
                     content = string_elem.get('CONTENT', '').strip()
                     if content:
@@ -1074,30 +1106,52 @@ class AltoBookToTeiConverter(AltoToTeiConverter):
         # Get output configuration from rule engine
         output_config = self.rule_engine.get_output_config()
 
-        # Create tree and apply standard indentation
-        tree = ET.ElementTree(tei_root)
-        ET.indent(tree, space="  ", level=0)  # Pretty print (Python 3.9+)
-
-        # Convert to string for custom formatting (always use unicode)
-        xml_str = ET.tostring(tei_root, encoding='unicode')
-
-        # Apply custom line break formatting if line breaks are preserved
-        if self.rule_engine.should_preserve_line_breaks():
-            # Format lb elements to appear on separate lines
-            import re
-            # Replace <lb /> with newline + indented <lb />
-            xml_str = re.sub(r'([^>\n])<lb />', r'\1\n      <lb />', xml_str)
-            # If lb is followed by text, put text on next line
-            xml_str = re.sub(r'<lb />([^<\n])', r'<lb />\n      \1', xml_str)
-
         # Get encoding for file writing
         encoding = output_config.get('encoding', 'utf-8')
 
-        with open(output_file, 'w', encoding=encoding) as f:
+        with open(output_file, 'w', encoding=encoding, buffering=IO_BUFFER_SIZE) as f:
             # Include XML declaration if configured
             if output_config.get('xml_declaration', True):
                 f.write(f'<?xml version="1.0" encoding="{encoding.upper()}"?>\n')
-            f.write(xml_str)
+            self.write_tei(tei_root, f)
+
+
+# Below this many pages the book converter works serially
+PARALLEL_MIN_PAGES = 8
+
+# Pages read ahead of the one being converted when working serially
+PREFETCH_PAGES = 8
+
+def _prefetch_file(path: Path) -> None:
+    """Ask the OS to start reading a file in the background (no-op where unsupported)"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+# Per-process converter used by AltoBookToTeiConverter page workers
+_worker_book_converter: Optional[AltoBookToTeiConverter] = None
+
+def _init_book_worker(mets_path: Path, merge_lines: bool, enable_facsimile: bool) -> None:
+    """Build the book converter once per worker process"""
+    global _worker_book_converter
+    _worker_book_converter = AltoBookToTeiConverter(mets_path, merge_lines=merge_lines,
+                                                    enable_facsimile=enable_facsimile, jobs=1)
+
+def _run_page_task(method_name: str, task: Tuple[Path, int]) -> Tuple[Any, Optional[Exception]]:
+    """Run one per-page converter method on a (page_path, page_number) task in a worker; return (result, error)"""
+    try:
+        return getattr(_worker_book_converter, method_name)(*task), None
+    except Exception as e:
+        return None, e
 
 
 def main():
@@ -1117,6 +1171,10 @@ def main():
                        help='Merge lines into paragraphs and handle hyphenation (default: True)')
     parser.add_argument('--facsimile', type=str, choices=['True', 'False'], default='True',
                        help='Include facsimile zones with spatial coordinates (default: True)')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                       help='Number of worker processes for page conversion (default: number of CPUs)')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                       help='Do not print a progress line for every page')
 
     args = parser.parse_args()
 
@@ -1157,7 +1215,8 @@ def main():
 
     try:
         converter = AltoBookToTeiConverter(mets_path, merge_lines=merge_lines,
-                                          enable_facsimile=enable_facsimile)
+                                          enable_facsimile=enable_facsimile, jobs=args.jobs,
+                                          verbose=not args.quiet)
         converter.convert_book_to_tei(output_path)
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -11,7 +11,7 @@ import xml.etree.ElementTree as ET
 import argparse
 import re
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from alto2tei import ConfigurationLoader as BaseConfigurationLoader, AltoToTeiConverter
 
 class TextConfigurationLoader(BaseConfigurationLoader):
@@ -48,6 +48,7 @@ class TextRuleEngine:
         self.page_handling = config_loader.get_page_handling()
         self.line_merging = config_loader.get_line_merging()
         self.hyphenation = config_loader.get_hyphenation()
+        self._compiled_hyphen_patterns = [re.compile(pattern) for pattern in self.get_hyphen_patterns()]
     
     def should_process_block(self, block_type: str) -> bool:
         """Check if a block type should be processed for content"""
@@ -96,6 +97,10 @@ class TextRuleEngine:
         """Get list of hyphenation patterns"""
         return self.hyphenation.get('hyphen_patterns', ['-$', '—$', '–$'])
     
+    def get_compiled_hyphen_patterns(self) -> List[re.Pattern]:
+        """Get hyphenation patterns compiled once at load time"""
+        return self._compiled_hyphen_patterns
+    
     def get_word_break_chars(self) -> list:
         """Get list of characters that indicate word breaks"""
         return self.hyphenation.get('word_break_chars', ['-', '—', '–'])
@@ -108,6 +113,13 @@ class AltoToTextConverter:
         self.tei_converter = AltoToTeiConverter()
         self.alto_ns = self.tei_converter.alto_ns
         
+        # Namespace-qualified tags, so lookups skip prefix resolution
+        alto_uri = self.alto_ns['alto']
+        self._page_tag = f'{{{alto_uri}}}Page'
+        self._textblock_tag = f'{{{alto_uri}}}TextBlock'
+        self._textline_tag = f'{{{alto_uri}}}TextLine'
+        self._string_tag = f'{{{alto_uri}}}String'
+        
         # Load text-specific configuration
         self.config_loader = TextConfigurationLoader(config_path)
         self.rule_engine = TextRuleEngine(self.config_loader)
@@ -136,11 +148,11 @@ class AltoToTextConverter:
         all_lines = []
         
         # Process each page
-        for page in alto_root.findall('.//alto:Page', self.alto_ns):
+        for page in alto_root.iter(self._page_tag):
             page_lines = []
             
             # Process textblocks
-            for textblock in page.findall('.//alto:TextBlock', self.alto_ns):
+            for textblock in page.iter(self._textblock_tag):
                 block_type = self.tei_converter.get_block_type(textblock, tags_mapping)
                 
                 # Skip non-content blocks
@@ -148,8 +160,8 @@ class AltoToTextConverter:
                     continue
                 
                 # Process textlines
-                for textline in textblock.findall('.//alto:TextLine', self.alto_ns):
-                    string_elem = textline.find('alto:String', self.alto_ns)
+                for textline in textblock.iter(self._textline_tag):
+                    string_elem = textline.find(self._string_tag)
                     if string_elem is None:
                         continue
 
@@ -191,9 +203,9 @@ class AltoToTextConverter:
         all_block_groups = []
         
         # Process each page
-        for page in alto_root.findall('.//alto:Page', self.alto_ns):
+        for page in alto_root.iter(self._page_tag):
             # Process textblocks
-            for textblock in page.findall('.//alto:TextBlock', self.alto_ns):
+            for textblock in page.iter(self._textblock_tag):
                 block_type = self.tei_converter.get_block_type(textblock, tags_mapping)
                 
                 # Skip non-content blocks
@@ -206,8 +218,8 @@ class AltoToTextConverter:
                 current_paragraph_id = None  # Track current paragraph for continuation
                 
                 # Process textlines within this textblock
-                for textline in textblock.findall('.//alto:TextLine', self.alto_ns):
-                    string_elem = textline.find('alto:String', self.alto_ns)
+                for textline in textblock.iter(self._textline_tag):
+                    string_elem = textline.find(self._string_tag)
                     if string_elem is None:
                         continue
 
@@ -354,7 +366,7 @@ class AltoToTextConverter:
         if len(lines) <= 1:
             return lines
         
-        patterns = self.rule_engine.get_hyphen_patterns()
+        patterns = self.rule_engine.get_compiled_hyphen_patterns()
         word_break_chars = self.rule_engine.get_word_break_chars()
         
         # Run hyphenation handling in a loop until no more changes
@@ -373,7 +385,7 @@ class AltoToTextConverter:
                 # Check if current line ends with hyphenation
                 is_hyphenated = False
                 for pattern in patterns:
-                    if re.search(pattern, current_line):
+                    if pattern.search(current_line):
                         is_hyphenated = True
                         break
                 
@@ -18,6 +18,12 @@ class FacsimileExtractor:
     def __init__(self, alto_namespace: str = 'http://www.loc.gov/standards/alto/ns-v4#'):
         """Initialize extractor with ALTO namespace"""
         self.alto_ns = {'alto': alto_namespace}
+        
+        # Namespace-qualified tags for generator-based traversal
+        self._textblock_tag = f'{{{alto_namespace}}}TextBlock'
+        self._textline_tag = f'{{{alto_namespace}}}TextLine'
+        self._string_tag = f'{{{alto_namespace}}}String'
+        self._polygon_path = f'{{{alto_namespace}}}Shape/{{{alto_namespace}}}Polygon'
     
     def extract_page_facsimile(self, alto_file: Path, page_number: int) -> PageFacsimile:
         """Extract all facsimile zones from an ALTO file
@@ -52,8 +58,7 @@ class FacsimileExtractor:
         zones = []
         
         # Extract TextBlock zones
-        textblocks = root.findall('.//alto:TextBlock', self.alto_ns)
-        for i, textblock in enumerate(textblocks):
+        for i, textblock in enumerate(root.iter(self._textblock_tag)):
             block_zone = self._extract_zone_from_element(
                 textblock, f"facs_block_{page_number}_{i+1}", 'textblock'
             )
@@ -61,8 +66,7 @@ class FacsimileExtractor:
                 zones.append(block_zone)
             
             # Extract TextLine zones within this block
-            textlines = textblock.findall('.//alto:TextLine', self.alto_ns)
-            for j, textline in enumerate(textlines):
+            for j, textline in enumerate(textblock.iter(self._textline_tag)):
                 line_zone = self._extract_zone_from_element(
                     textline, f"facs_line_{page_number}_{i+1}_{j+1}", 'textline'
                 )
@@ -74,8 +78,7 @@ class FacsimileExtractor:
                     zones.append(line_zone)
                 
                 # Extract String zones (word-level) - optional
-                strings = textline.findall('.//alto:String', self.alto_ns)
-                for k, string in enumerate(strings):
+                for k, string in enumerate(textline.iter(self._string_tag)):
                     string_zone = self._extract_zone_from_element(
                         string, f"facs_string_{page_number}_{i+1}_{j+1}_{k+1}", 'string'
                     )
@@ -110,11 +113,9 @@ class FacsimileExtractor:
         
         # Extract polygon if available for more precise boundaries
         polygon = None
-        shape_elem = element.find('alto:Shape', self.alto_ns)
-        if shape_elem is not None:
-            polygon_elem = shape_elem.find('alto:Polygon', self.alto_ns)
-            if polygon_elem is not None:
-                polygon = polygon_elem.get('POINTS')
+        polygon_elem = element.find(self._polygon_path)
+        if polygon_elem is not None:
+            polygon = polygon_elem.get('POINTS')
         
         return FacsimileZone(
             id=zone_id,
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the ALTO to Markdown converter (alto2md.py)
+
+Tests cover:
+- Page number extraction from NumberingZone blocks
+- Markdown escaping combined with line merging and dehyphenation
+- Line templates in merged groups
+- Hyphen patterns that can't be folded into one regex
+"""
+
+import unittest
+import tempfile
+import os
+import sys
+import yaml
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from alto2md import AltoToMarkdownConverter, MarkdownConfigurationLoader, MarkdownRuleEngine
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'config', 'alto_markdown_mapping.yaml')
+
+
+def make_alto(blocks):
+    """Build a minimal ALTO document from (block_type, [(line_type, text), ...]) pairs"""
+    tags = {'MainZone': 'BT1', 'NumberingZone': 'BT2', 'DefaultLine': 'LT1',
+            'CustomLine:verse': 'LT2', 'CustomLine:marked': 'LT3'}
+    textblocks = []
+    for block_index, (block_type, lines) in enumerate(blocks):
+        textlines = ''.join(
+            f'<TextLine ID="l{block_index}_{line_index}" TAGREFS="{tags[line_type]}">'
+            f'<String CONTENT="{text}"/></TextLine>'
+            for line_index, (line_type, text) in enumerate(lines)
+        )
+        textblocks.append(f'<TextBlock ID="b{block_index}" TAGREFS="{tags[block_type]}">{textlines}</TextBlock>')
+    other_tags = ''.join(f'<OtherTag ID="{tag_id}" LABEL="{label}"/>' for label, tag_id in tags.items())
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<alto xmlns="http://www.loc.gov/standards/alto/ns-v4#">'
+        f'<Tags>{other_tags}</Tags>'
+        f'<Layout><Page ID="p1"><PrintSpace>{"".join(textblocks)}</PrintSpace></Page></Layout>'
+        '</alto>'
+    )
+
+
+class TestMarkdownConversion(unittest.TestCase):
+    """Test Markdown output for small ALTO documents"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_config(self, updates):
+        """Write a copy of the default config with some sections updated"""
+        with open(CONFIG_PATH, encoding='utf-8') as f:
+            config = yaml.safe_load(f)
+        for section, values in updates.items():
+            config[section].update(values)
+        # A new file each time, so the loader's (mtime, size) cache can't return a stale config
+        fd, config_path = tempfile.mkstemp(suffix='.yaml', dir=self.temp_dir)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            yaml.dump(config, f, allow_unicode=True)
+        return config_path
+
+    def convert(self, blocks, merge_lines=False, escape_markdown=False, config_updates=None):
+        alto_file = Path(self.temp_dir) / 'page.xml'
+        alto_file.write_text(make_alto(blocks), encoding='utf-8')
+        config_updates = dict(config_updates or {})
+        if escape_markdown:
+            config_updates['markdown_structure'] = {'escape_markdown': True}
+        config_path = self.write_config(config_updates) if config_updates else CONFIG_PATH
+        converter = AltoToMarkdownConverter(config_path, merge_lines=merge_lines)
+        return converter, converter.convert_alto_to_markdown(alto_file)
+
+    def test_superscript_page_number(self):
+        """Page labels made only of non-decimal digits are still page numbers"""
+        _, markdown = self.convert([
+            ('NumberingZone', [('DefaultLine', '²')]),
+            ('MainZone', [('DefaultLine', 'Text')]),
+        ])
+        self.assertIn('*Page ²*', markdown)
+
+    def test_escaping_with_line_merging(self):
+        """Escaping is applied after dehyphenation, so hyphenated words are still joined"""
+        _, markdown = self.convert([
+            ('MainZone', [('DefaultLine', 'inter-'), ('DefaultLine', 'national *trade*'),
+                          ('DefaultLine', 'well-known.')]),
+        ], merge_lines=True, escape_markdown=True)
+        self.assertEqual(markdown, 'international \\*trade\\* well\\-known\\.')
+
+    def test_escaping_without_line_merging(self):
+        """Without merging every line is escaped on its own"""
+        _, markdown = self.convert([
+            ('MainZone', [('DefaultLine', 'inter-'), ('DefaultLine', 'national')]),
+        ], escape_markdown=True)
+        self.assertEqual(markdown, 'inter\\- national')
+
+    def test_merged_lines_keep_their_own_template(self):
+        """Merged paragraph lines are rendered with their own line type's template"""
+        marked_line = {'template': '{text} †', 'add_to_paragraph': True, 'paragraph_type': 'paragraph'}
+        _, markdown = self.convert([
+            ('MainZone', [('DefaultLine', 'one'), ('CustomLine:marked', 'two'), ('DefaultLine', 'three')]),
+        ], merge_lines=True, config_updates={'line_types': {'CustomLine:marked': marked_line}})
+        self.assertEqual(markdown, 'one two † three')
+
+    def test_dehyphenated_line_uses_first_template(self):
+        """Lines joined across a hyphen are rendered once, with the first line's template"""
+        _, markdown = self.convert([
+            ('MainZone', [('CustomLine:verse', 'foo-'), ('CustomLine:verse', 'bar'),
+                          ('CustomLine:verse', 'baz')]),
+        ], merge_lines=True, config_updates={'line_merging': {'merge_verse_lines': True}})
+        self.assertEqual(markdown, '> foobar > baz')
+
+    def test_hyphen_patterns_not_combinable(self):
+        """Patterns with inline flags or groups are tried one by one in configured order"""
+        config_path = self.write_config({'hyphenation': {'hyphen_patterns': ['(?i)X$', '-$']}})
+        engine = MarkdownRuleEngine(MarkdownConfigurationLoader(config_path))
+        self.assertEqual(engine.find_hyphen('wordx').group(), 'x')
+        self.assertEqual(engine.find_hyphen('word-').group(), '-')
+        self.assertIsNone(engine.find_hyphen('word'))
+
+        config_path = self.write_config({'hyphenation': {'hyphen_patterns': ['(-)\\1$', '-$']}})
+        engine = MarkdownRuleEngine(MarkdownConfigurationLoader(config_path))
+        self.assertEqual(engine.find_hyphen('word--').group(), '--')
+        self.assertEqual(engine.find_hyphen('word-').group(), '-')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,7 +16,7 @@ import os
 import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from typing import Dict, List, Any
 
 # Add parent directory to path to import modules
@@ -84,6 +84,30 @@ class TestConfigurationLoader(unittest.TestCase):
         finally:
             os.unlink(config_path)
     
+    def test_config_parsed_once_per_file(self):
+        """Test loaders for an unchanged file reuse the parsed config, each with its own copy"""
+        first = ConfigurationLoader("config/alto_tei_mapping.yaml")
+        with patch('alto2tei.yaml.load') as yaml_load:
+            second = ConfigurationLoader("config/alto_tei_mapping.yaml")
+        yaml_load.assert_not_called()
+        self.assertEqual(first.config, second.config)
+        self.assertIsNot(first.config, second.config)
+    
+    def test_line_break_override_not_shared(self):
+        """Test a converter's line break override doesn't leak into the shared config"""
+        AltoToTeiConverter(preserve_line_breaks=False)
+        converter = AltoToTeiConverter()
+        self.assertTrue(converter.rule_engine.should_preserve_line_breaks())
+    
+    def test_rule_engine_changes_not_shared(self):
+        """Test changing one converter's rule engine settings in place leaves other converters alone"""
+        first = AltoToTeiConverter()
+        second = AltoToTeiConverter()
+        first.rule_engine.tei_structure['body']['preserve_line_breaks'] = False
+        self.assertFalse(first.rule_engine.should_preserve_line_breaks())
+        self.assertTrue(second.rule_engine.should_preserve_line_breaks())
+        self.assertTrue(AltoToTeiConverter().rule_engine.should_preserve_line_breaks())
+    
     def test_config_file_not_found(self):
         """Test handling of missing config file"""
         with self.assertRaises(FileNotFoundError):
@@ -319,6 +343,18 @@ class TestRuleEngine(unittest.TestCase):
         block_type = self.converter.resolve_tag_type(element, self.tags_mapping, 'BT')
         self.assertTrue(self.rule_engine.should_extract_page_number(block_type))
     
+    def test_match_footnote_symbol_uses_first_pattern(self):
+        """Test the combined footnote pattern keeps the configured pattern order"""
+        match = self.rule_engine.match_footnote_symbol('(*) Note text')
+        self.assertEqual(match.group(), '(*) ')
+        self.assertIsNone(self.rule_engine.match_footnote_symbol('Plain text'))
+    
+    def test_unknown_block_type_flags(self):
+        """Test block types missing from the config get all-false flags"""
+        self.assertFalse(self.rule_engine.should_process_block('NoSuchZone'))
+        self.assertFalse(self.rule_engine.should_skip_block('NoSuchZone'))
+        self.assertFalse(self.rule_engine.should_create_block_element('NoSuchZone'))
+    
     def test_get_line_mapping(self):
         """Test line type mapping retrieval using real ALTO data"""
         # Example: Check line mapping for a line with TAGREFS 'LT74'
@@ -377,6 +413,33 @@ class TestTagParsing(unittest.TestCase):
         result = self.converter.resolve_tag_type(element, self.tags_mapping, 'LT')
         self.assertEqual(result, 'DefaultLine')  # Default for lines
 
+    def test_resolve_tagrefs_multiple_refs(self):
+        """Test resolution from a raw TAGREFS value with several references"""
+        result = self.converter.resolve_tagrefs('BT2 LT79', self.tags_mapping, 'LT')
+        self.assertEqual(result, 'CustomLine:verse')
+    
+    def test_resolve_tagrefs_cache_follows_mapping(self):
+        """Test cached resolutions are not reused for a different tags mapping"""
+        self.assertEqual(self.converter.resolve_tagrefs('LT79', self.tags_mapping, 'LT'), 'CustomLine:verse')
+        other_mapping = {'LT79': 'DefaultLine'}
+        self.assertEqual(self.converter.resolve_tagrefs('LT79', other_mapping, 'LT'), 'DefaultLine')
+    
+    def test_resolve_tagrefs_cache_follows_in_place_change(self):
+        """Test resolutions are only memoized within one file's conversion"""
+        tags_mapping = dict(self.tags_mapping)
+        self.assertEqual(self.converter.resolve_tagrefs('LT79', tags_mapping, 'LT'), 'CustomLine:verse')
+        tags_mapping['LT79'] = 'DefaultLine'
+        self.assertEqual(self.converter.resolve_tagrefs('LT79', tags_mapping, 'LT'), 'DefaultLine')
+        
+        # Each conversion starts with an empty memo and drops it when done
+        self.converter.convert_alto_to_tei(alto_root=ET.Element('{http://www.loc.gov/standards/alto/ns-v4#}alto'))
+        self.assertIsNone(self.converter._resolve_cache)
+        with self.converter._tagrefs_memo():
+            self.assertEqual(self.converter.resolve_tagrefs('LT79', tags_mapping, 'LT'), 'DefaultLine')
+        tags_mapping['LT79'] = 'CustomLine:verse'
+        with self.converter._tagrefs_memo():
+            self.assertEqual(self.converter.resolve_tagrefs('LT79', tags_mapping, 'LT'), 'CustomLine:verse')
+
 
 class TestLineProcessing(unittest.TestCase):
     """Test line processing with YAML configuration"""
@@ -858,6 +921,31 @@ class TestLineBreakPreservation(unittest.TestCase):
         self.assertTrue('First line of text' in paragraph.text)
         self.assertTrue('Second line of text' in (lb_elements[0].tail or ''))
         self.assertTrue('Third line of text' in (lb_elements[1].tail or ''))
+    
+    def test_write_tei_matches_whole_tree_serialization(self):
+        """Test streamed TEI output equals formatting the whole serialized tree"""
+        import copy
+        import io
+        import re
+        
+        tei_root = ET.Element('TEI')
+        tei_root.set('xmlns', 'http://www.tei-c.org/ns/1.0')
+        body = ET.SubElement(ET.SubElement(tei_root, 'text'), 'body')
+        paragraph = ET.SubElement(body, 'p')
+        paragraph.text = 'First & line'
+        lb = ET.SubElement(paragraph, 'lb')
+        lb.tail = 'Second line'
+        
+        # Reference: format the serialized, indented tree with the original regexes
+        reference = copy.deepcopy(tei_root)
+        ET.indent(reference, space="  ", level=0)
+        expected = ET.tostring(reference, encoding='unicode')
+        expected = re.sub(r'([^>\n])<lb />', r'\1\n      <lb />', expected)
+        expected = re.sub(r'<lb />([^<\n])', r'<lb />\n      \1', expected)
+        
+        out = io.StringIO()
+        self.converter.write_tei(tei_root, out)
+        self.assertEqual(out.getvalue(), expected)
 
 
 class TestFacsimileOutput(unittest.TestCase):
@@ -999,6 +1087,33 @@ class TestIntegration(unittest.TestCase):
         content_paragraphs = [p for p in paragraphs if len(p.text or '') > 10]
         self.assertGreater(len(content_paragraphs), 0, "Should contain substantial paragraph content")
 
+    def test_aggregate_output_matches_saved_file(self):
+        """Test the in-memory TEI used for ZIP archives matches the file save_tei writes"""
+        if not (self.alto_dir / '0aefed141cd6.xml').exists():
+            self.skipTest("Test ALTO file not found")
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir)
+            input_file = self.alto_dir / '0aefed141cd6.xml'
+            saved = self.converter._process_single_file(input_file, output_path, '_tei')
+            archived = self.converter._process_single_file(input_file, output_path, '_tei', in_memory=True)
+            
+            self.assertEqual(archived.output_file, saved.output_file)
+            self.assertEqual(archived.tei_bytes, (output_path / saved.output_file).read_bytes())
+    
+    def test_convert_and_collect_matches_separate_passes(self):
+        """Test single-pass conversion returns the same TEI and metadata as separate passes"""
+        if not (self.alto_dir / '0aefed141cd6.xml').exists():
+            self.skipTest("Test ALTO file not found")
+
+        alto_root = ET.parse(self.alto_dir / '0aefed141cd6.xml').getroot()
+        tei_root, metadata = self.converter.convert_and_collect(alto_root=alto_root)
+
+        self.assertEqual(metadata.to_dict(), self.converter.extract_metadata_from_tree(alto_root))
+        self.assertTrue(self.converter.extract_metadata_from_tree(alto_root)['has_poetry'])
+        self.assertEqual(ET.tostring(tei_root),
+                         ET.tostring(self.converter.convert_alto_to_tei(alto_root=alto_root)))
+
 
 class TestErrorHandling(unittest.TestCase):
     """Test error handling and edge cases"""
@@ -1046,6 +1161,34 @@ class TestErrorHandling(unittest.TestCase):
         
         self.assertEqual(len(elements), 1)
         self.assertEqual(elements[0].tag, 'p')
+    
+    def test_truncated_alto_file_skipped(self):
+        """Test a truncated ALTO file is skipped with a parsing error"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = Path(temp_dir) / 'broken.xml'
+            input_path.write_text('<alto xmlns="http://www.loc.gov/standards/alto/ns-v4#"><Layout>',
+                                  encoding='utf-8')
+            
+            result = self.converter._process_single_file(input_path, Path(temp_dir), '_tei')
+            self.assertTrue(result.skipped)
+            self.assertTrue(result.reason.startswith('XML parsing error'))
+            self.assertFalse((Path(temp_dir) / 'broken_tei.xml').exists())
+
+    def test_is_alto_file_root_detection(self):
+        """Test ALTO detection from the root start tag, including namespace-only matches"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cases = {
+                'tei.xml': ('<?xml version="1.0"?>\n<TEI xmlns="http://www.tei-c.org/ns/1.0"><text/></TEI>', False),
+                'alto.xml': ('<?xml version="1.0"?>\n<alto xmlns="http://www.loc.gov/standards/alto/ns-v4#"/>', True),
+                'ns_only.xml': ('<root xmlns="http://www.loc.gov/standards/alto/ns-v4#"/>', True),
+                'quoted.xml': ('<root note=">" xmlns="http://www.loc.gov/standards/alto/ns-v4#"/>', True),
+                'comment.xml': ('<!-- <alto> --><TEI/>', False),
+                'empty.xml': ('', False),
+            }
+            for name, (content, expected) in cases.items():
+                path = Path(temp_dir) / name
+                path.write_text(content, encoding='utf-8')
+                self.assertEqual(self.converter.is_alto_file(path), expected, name)
 
 
 class TestRegressionFixes(unittest.TestCase):
@@ -14,6 +14,7 @@ Tests cover:
 
 import unittest
 import tempfile
+import io
 import os
 import sys
 import xml.etree.ElementTree as ET
@@ -390,6 +391,52 @@ class TestBookConversionIntegration(unittest.TestCase):
         tei_root = tree.getroot()
         self.assertTrue(tei_root.tag.endswith('TEI'))
 
+    def test_parallel_page_processing_matches_serial(self):
+        """Test converting pages in worker processes gives the same book as converting serially"""
+        outputs = []
+        for jobs in (1, 2):
+            converter = AltoBookToTeiConverter(self.mets_path, jobs=jobs)
+            output_file = self.output_dir / f'test_book_jobs_{jobs}.xml'
+
+            # Enough pages to use the worker pool
+            original_get_page_order = converter.mets_parser.get_page_order
+            def mock_get_page_order():
+                return original_get_page_order()[:10]
+            converter.mets_parser.get_page_order = mock_get_page_order
+
+            converter.convert_book_to_tei(output_file)
+            outputs.append(output_file.read_bytes())
+
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_write_tei_streams_book_page_content(self):
+        """Test the book's lone page div is written child by child rather than as one string"""
+        converter = AltoBookToTeiConverter(self.mets_path)
+        converter.mets_parser.get_page_order = lambda: ['page_5.xml', 'page_7.xml']
+        book_metadata = converter._get_book_metadata_and_validate()
+        converter._extract_facsimiles_if_enabled()
+        converter._process_all_pages_in_order()
+        book_tei = converter._create_and_clean_book_tei(book_metadata)
+        book_div = book_tei.find('text/body/div')
+        self.assertEqual(len(book_tei.find('text/body')), 1)
+        self.assertGreater(len(book_div), 1)
+
+        serialized = []
+        original_tostring = ET.tostring
+        def recording_tostring(elem, *args, **kwargs):
+            serialized.append(elem)
+            return original_tostring(elem, *args, **kwargs)
+
+        out = io.StringIO()
+        with patch('alto2tei.ET.tostring', side_effect=recording_tostring):
+            converter.write_tei(book_tei, out)
+
+        # The div itself is only written as a childless shell; its children go one at a time
+        self.assertFalse(any(elem is book_div for elem in serialized))
+        for child in book_div:
+            self.assertTrue(any(elem is child for elem in serialized))
+        self.assertEqual(out.getvalue(), original_tostring(book_tei, encoding='unicode'))
+
 
 class TestLineMergingFunctionality(unittest.TestCase):
     """Test line merging specific functionality"""
@@ -492,7 +539,22 @@ class TestEdgeCasesAndErrorHandling(unittest.TestCase):
         finally:
             if output_file.exists():
                 output_file.unlink()
-    
+
+    def test_find_existing_pages_matches_exists(self):
+        """Test the batched page existence check agrees with Path.exists()"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            book_dir = Path(temp_dir)
+            (book_dir / 'page_1.xml').write_text('<alto/>')
+            (book_dir / 'sub').mkdir()
+            (book_dir / 'sub' / 'page_2.xml').write_text('<alto/>')
+            os.symlink(book_dir / 'gone.xml', book_dir / 'dangling.xml')
+
+            page_paths = [book_dir / name for name in
+                          ['page_1.xml', 'PAGE_1.XML', 'sub/page_2.xml', 'page_3.xml', 'dangling.xml',
+                           'missing/page_4.xml']]
+            self.assertEqual(AltoBookToTeiConverter._find_existing_pages(page_paths),
+                             [page_path.exists() for page_path in page_paths])
+
     def test_empty_alto_files(self):
         """Test handling of empty/invalid ALTO files"""
         # Create temporary empty ALTO file